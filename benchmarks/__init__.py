@@ -0,0 +1 @@
+"""Standalone benchmarks; run as ``python -m benchmarks.<name>``."""
@@ -0,0 +1,69 @@
+"""Compare the Aho–Corasick club matcher with the old substring scan.
+
+Run from the repository root:
+    python -m benchmarks.bench_club_matcher
+"""
+import random
+import time
+from typing import List
+
+from config import CLUB_ALIASES, FOOTBALL_CLUBS
+from parsers.club_matcher import ClubMatcher
+
+WORDS = (
+    "матч гол тренер игрок сезон чемпионат лига кубок трансфер контракт "
+    "защитник нападающий вратарь победа поражение ничья тур счет поле"
+).split()
+
+
+def substring_scan(clubs: List[str], text: str) -> List[str]:
+    """Previous BaseParser.find_mentioned_clubs implementation."""
+    text_lower = text.lower()
+    return [club for club in clubs if club.lower() in text_lower]
+
+
+def make_clubs(count: int) -> List[str]:
+    clubs = list(FOOTBALL_CLUBS)
+    while len(clubs) < count:
+        clubs.append(f"Клуб{len(clubs)}")
+    return clubs
+
+
+def make_texts(clubs: List[str], count: int, words: int) -> List[str]:
+    rng = random.Random(42)
+    texts = []
+    for _ in range(count):
+        body = [rng.choice(WORDS) for _ in range(words)]
+        for _ in range(2):
+            body.insert(rng.randrange(len(body)), rng.choice(clubs))
+        texts.append(" ".join(body))
+    return texts
+
+
+def bench(label: str, func, texts: List[str]) -> float:
+    started = time.perf_counter()
+    for text in texts:
+        func(text)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<14} {elapsed * 1000:8.1f} ms  ({elapsed / len(texts) * 1e6:.1f} µs/text)")
+    return elapsed
+
+
+def main():
+    for club_count in (len(FOOTBALL_CLUBS), 200, 800):
+        for words in (30, 400):
+            clubs = make_clubs(club_count)
+            texts = make_texts(clubs, count=500, words=words)
+
+            started = time.perf_counter()
+            matcher = ClubMatcher(clubs, aliases=CLUB_ALIASES)
+            build_ms = (time.perf_counter() - started) * 1000
+
+            print(f"{club_count} clubs, {words}-word texts (matcher build {build_ms:.1f} ms)")
+            old = bench("substring", lambda t: substring_scan(clubs, t), texts)
+            new = bench("aho-corasick", matcher.find, texts)
+            print(f"  speedup x{old / new:.1f}")
+
+
+if __name__ == "__main__":
+    main()
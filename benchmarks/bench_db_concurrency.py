@@ -0,0 +1,144 @@
+"""Handler read latency while the scraper bulk-ingests into SQLite.
+
+Runs the same workload twice on fresh database files: once on a default
+engine (rollback journal, a new connection per session) and once on the
+engine from database.backends (WAL, pragmas, pooled connections). As in
+production, ingestion runs in its own process (the scraper worker) and
+inserts article batches through add_news_items, while reader tasks in this
+process issue the queries /news and subscription handlers run.
+
+Run from the repository root:
+    python -m benchmarks.bench_db_concurrency [batches] [readers]
+"""
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import List
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from config import FOOTBALL_CLUBS
+from database import Database
+
+BATCH_SIZE = 200
+USERS = 500
+
+
+def make_batch(rng: random.Random, batch: int) -> List[dict]:
+    items = []
+    for i in range(BATCH_SIZE):
+        clubs = rng.sample(FOOTBALL_CLUBS, 2)
+        items.append(
+            {
+                "title": f"{clubs[0]} и {clubs[1]}: новость {batch}-{i}",
+                "url": f"https://example.com/news/{batch}/{i}",
+                "source": "bench",
+                "description": "Подробности матча. " * 30,
+                "clubs_mentioned": clubs,
+            }
+        )
+    return items
+
+
+async def seed_users(db: Database):
+    rng = random.Random(7)
+    for telegram_id in range(1, USERS + 1):
+        await db.get_or_create_user(telegram_id, f"user{telegram_id}")
+        for club in rng.sample(FOOTBALL_CLUBS, 3):
+            await db.add_user_club(telegram_id, club)
+
+
+def make_database(url: str, tuned: bool) -> Database:
+    if tuned:
+        return Database(url)
+    return Database(url, engine=create_async_engine(url))
+
+
+async def ingest(url: str, tuned: bool, batches: int) -> tuple:
+    db = make_database(url, tuned)
+    rng = random.Random(42)
+    failed = 0
+    started = time.perf_counter()
+    for batch in range(batches):
+        try:
+            await db.add_news_items(make_batch(rng, batch))
+        except Exception:
+            # "database is locked": the scraper would lose this batch
+            failed += 1
+    elapsed = time.perf_counter() - started
+    await db.close()
+    return elapsed, failed
+
+
+def ingest_process(url: str, tuned: bool, batches: int, results):
+    results.put(asyncio.run(ingest(url, tuned, batches)))
+
+
+async def reader(
+    db: Database, seed: int, done: asyncio.Event, latencies: List[float], errors: list
+):
+    rng = random.Random(seed)
+    while not done.is_set():
+        telegram_id = rng.randint(1, USERS)
+        started = time.perf_counter()
+        try:
+            # What /news does: subscriptions, then a page of their news
+            db.subscription_cache.invalidate(telegram_id)
+            clubs = await db.get_user_clubs(telegram_id)
+            await db.get_news_page(clubs, limit=6)
+            await db.get_recent_news(limit=10)
+        except Exception as e:
+            errors.append(type(e).__name__)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0)
+
+
+async def run(label: str, url: str, tuned: bool, batches: int, readers: int):
+    db = make_database(url, tuned)
+    await db.init_db()
+    await seed_users(db)
+
+    done = asyncio.Event()
+    latencies: List[float] = []
+    errors: list = []
+    reader_tasks = [
+        asyncio.create_task(reader(db, seed, done, latencies, errors))
+        for seed in range(readers)
+    ]
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    writer = context.Process(target=ingest_process, args=(url, tuned, batches, results))
+    writer.start()
+    ingest_seconds, failed_batches = await asyncio.to_thread(results.get)
+    done.set()
+    await asyncio.to_thread(writer.join)
+    await asyncio.gather(*reader_tasks)
+    await db.close()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95)]
+    print(
+        f"{label:<8} ingest {batches * BATCH_SIZE / ingest_seconds:7.0f} rows/s, "
+        f"{failed_batches} batches failed | "
+        f"{len(latencies):6d} reads, p50 {statistics.median(latencies):6.1f} ms, "
+        f"p95 {p95:6.1f} ms, max {latencies[-1]:7.1f} ms | errors {len(errors)}"
+    )
+
+
+async def main():
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    directory = tempfile.mkdtemp()
+
+    for label, tuned in (("default", False), ("tuned", True)):
+        url = f"sqlite+aiosqlite:///{os.path.join(directory, label + '.db')}"
+        await run(label, url, tuned, batches, readers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
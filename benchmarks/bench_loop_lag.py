@@ -0,0 +1,84 @@
+"""Measure event-loop lag while listing pages are parsed.
+
+Simulates a scheduled update that parses one large listing page per source,
+first inline on the loop (previous behaviour), then in the parse executor.
+A ticker coroutine records how late it wakes up, which is the delay every
+aiogram handler would see.
+
+Run from the repository root:
+    python -m benchmarks.bench_loop_lag
+"""
+import asyncio
+import statistics
+import time
+from typing import List
+
+from config import FOOTBALL_CLUBS, NEWS_SOURCES
+from parsers import SelectorParser
+from parsers import executor as parse_executor
+
+TICK = 0.005
+
+
+def make_listing(items: int) -> str:
+    blocks = []
+    for i in range(items):
+        club = FOOTBALL_CLUBS[i % len(FOOTBALL_CLUBS)]
+        blocks.append(
+            f'<div class="news-item article news"><h3 class="title">{club}: новость {i}</h3>'
+            f'<a href="/football/news/{i}.html">читать</a>'
+            f'<p class="anons description">Подробности матча {club} и других клубов. '
+            f'{"Текст анонса. " * 20}</p></div>'
+        )
+    return f"<html><body>{''.join(blocks)}</body></html>"
+
+
+async def ticker(lags: List[float], stop: asyncio.Event):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_update(mode: str, html: str) -> None:
+    parse_executor.PARSE_EXECUTOR = mode
+    parsers = [
+        SelectorParser(key, spec, clubs=FOOTBALL_CLUBS, http_client=None)
+        for key, spec in NEWS_SOURCES.items()
+    ]
+
+    # Warm the pool so worker start-up is not counted as parse lag
+    await parse_executor.run_in_parse_executor(parsers[0].extract, "<html></html>")
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *[parse_executor.run_in_parse_executor(p.extract, html) for p in parsers]
+    )
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await tick_task
+    parse_executor.shutdown_parse_executor()
+
+    print(
+        f"{mode:<8} update {elapsed * 1000:7.1f} ms | loop lag "
+        f"max {max(lags) * 1000:7.1f} ms, p50 {statistics.median(lags) * 1000:5.2f} ms, "
+        f"ticks {len(lags)}"
+    )
+
+
+async def main():
+    html = make_listing(3000)
+    print(f"Listing page size: {len(html) / 1024:.0f} KiB, 3 sources")
+    for mode in ("inline", "thread", "process"):
+        await run_update(mode, html)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Time /search queries on a synthetic corpus against a plain LIKE scan.
+
+Fills a temporary SQLite database with generated articles (the FTS5 index
+is maintained by its insert trigger), then times ranked search pages for a
+few queries next to the LIKE fallback used when no index exists.
+
+Run from the repository root:
+    python -m benchmarks.bench_search [article_count]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from config import FOOTBALL_CLUBS
+from database import Database, NewsItem
+
+TOPIC_WORDS = (
+    "матч гол тренер игрок сезон чемпионат лига кубок трансфер контракт "
+    "защитник нападающий вратарь победа поражение ничья тур счет поле "
+    "травма аренда сборная болельщики стадион судья пенальти дерби"
+).split()
+SYLLABLES = "ба ве ги до ку ла ми но пу ра се ти фу ха це чи ша эр юн як".split()
+QUERIES = ["трансфер Зенит", "Спартак", "травма нападающего", "дерби пенальти судья"]
+BATCH = 5000
+REPEATS = 20
+
+
+def make_vocabulary(rng: random.Random, size: int = 20000) -> list:
+    words = {"".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(size)}
+    return TOPIC_WORDS + sorted(words)
+
+
+def make_rows(count: int):
+    rng = random.Random(42)
+    vocabulary = make_vocabulary(rng)
+    # Zipf-like word frequencies, topic words being the most common
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    started = datetime.utcnow() - timedelta(days=365)
+    for i in range(count):
+        club = rng.choice(FOOTBALL_CLUBS)
+        title = f"{club}: {' '.join(rng.choices(vocabulary, weights, k=6))}"
+        description = " ".join(rng.choices(vocabulary, weights, k=30))
+        yield {
+            "title": title,
+            "url": f"https://example.com/news/{i}",
+            "source": "bench",
+            "description": description,
+            "clubs_mentioned": club,
+            "created_at": started + timedelta(seconds=i * 30),
+        }
+
+
+async def fill(db: Database, count: int):
+    rows = make_rows(count)
+    started = time.perf_counter()
+    async with db.engine.begin() as conn:
+        while True:
+            batch = [row for _, row in zip(range(BATCH), rows)]
+            if not batch:
+                break
+            await conn.execute(NewsItem.__table__.insert(), batch)
+    print(f"Inserted {count} articles in {time.perf_counter() - started:.1f} s")
+
+
+async def time_query(db: Database, query: str, offset: int = 0) -> tuple:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        items = await db.search_news(query, limit=6, offset=offset)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), len(items)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    path = os.path.join(tempfile.mkdtemp(), "bench_search.db")
+    db = Database(f"sqlite+aiosqlite:///{path}")
+    await db.init_db()
+    await fill(db, count)
+    print(f"Database size: {os.path.getsize(path) / 1024 / 1024:.0f} MiB")
+
+    for query in QUERIES:
+        db.search_backend = "fts5"
+        first_ms, found = await time_query(db, query)
+        deep_ms, _ = await time_query(db, query, offset=60)
+        db.search_backend = "like"
+        like_ms, _ = await time_query(db, query)
+        print(
+            f"{query:<24} fts5 p50 {first_ms:7.2f} ms (page 11: {deep_ms:7.2f} ms, "
+            f"{found} shown) | LIKE {like_ms:8.2f} ms"
+        )
+
+    await db.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""Compare SelectorParser with the previous BeautifulSoup extraction loop.
+
+Builds a listing page per source in the shape its selectors expect, with
+nested blocks that broad selectors match twice, and times per-page
+extraction for both paths. The old path is reproduced here as it was in the
+removed per-source parser modules (select/select_one per item).
+
+BeautifulSoup is not a runtime dependency; install it with
+    pip install -r benchmarks/requirements.txt
+
+Run from the repository root:
+    python -m benchmarks.bench_selector_parser
+"""
+import time
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+
+from config import FOOTBALL_CLUBS, NEWS_SOURCES
+from parsers import SelectorParser
+from parsers.club_matcher import get_club_matcher
+
+REPEATS = 5
+
+
+def make_listing(items: int) -> str:
+    blocks = []
+    for i in range(items):
+        club = FOOTBALL_CLUBS[i % len(FOOTBALL_CLUBS)]
+        blocks.append(
+            f'<div class="news-item article news item">'
+            f'<div class="article-body"><h3 class="title _title">{club}: новость {i}</h3>'
+            f'<a href="/football/news/{i}.html">читать</a></div>'
+            f'<p class="anons description _text text">Подробности матча {club}. '
+            f'{"Текст анонса. " * 10}</p></div>'
+        )
+    return f"<html><body>{''.join(blocks)}</body></html>"
+
+
+def beautifulsoup_extract(spec: Dict, html: str) -> List[dict]:
+    """Previous per-source parser loop, minus the network and the 20-item cap."""
+    matcher = get_club_matcher(tuple(FOOTBALL_CLUBS))
+    selectors = spec["selectors"]
+    soup = BeautifulSoup(html, "lxml")
+    articles = []
+
+    for item in soup.select(selectors["item"]):
+        title_elem = item.select_one(selectors["title"])
+        if not title_elem:
+            continue
+        title = title_elem.get_text(strip=True)
+
+        link_elem = item.select_one("a[href]")
+        if not link_elem:
+            continue
+        link = link_elem.get("href", "")
+        if link.startswith("/"):
+            link = f"{spec['base_url']}{link}"
+
+        desc_elem = item.select_one(selectors["description"])
+        description = desc_elem.get_text(strip=True) if desc_elem else None
+
+        clubs = matcher.find(f"{title} {description or ''}")
+        if clubs:
+            articles.append({"title": title, "url": link, "clubs": clubs})
+
+    return articles
+
+
+def timed(func, *args) -> tuple:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main():
+    for items in (20, 200, 2000):
+        html = make_listing(items)
+        print(f"\nListing with {items} items ({len(html) / 1024:.0f} KiB)")
+        for key, spec in NEWS_SOURCES.items():
+            parser = SelectorParser(key, spec, clubs=FOOTBALL_CLUBS, http_client=None)
+            soup_ms, soup_articles = timed(beautifulsoup_extract, spec, html)
+            lxml_ms, page = timed(parser.extract, html)
+            print(
+                f"  {spec['name']:<16} bs4 {soup_ms:8.2f} ms ({len(soup_articles):5} items) | "
+                f"selector {lxml_ms:8.2f} ms ({len(page.articles):5} items) | "
+                f"x{soup_ms / lxml_ms:5.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Throughput of the webhook endpoint under a fake Telegram update poster.
+
+Starts the real aiohttp webhook app on localhost with a counting handler
+(no Telegram API calls) and posts synthetic updates concurrently.
+
+Run from the repository root:
+    python -m benchmarks.bench_webhook [updates] [concurrency]
+"""
+import asyncio
+import sys
+import time
+
+import aiohttp
+from aiogram import Bot, Dispatcher
+from aiogram.types import Message
+from aiohttp import web
+
+from bot.webhook import create_webhook_app
+
+HOST = "127.0.0.1"
+PORT = 8089
+PATH = "/webhook"
+SECRET = "bench-secret"
+
+
+def make_update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": 1000 + update_id % 500, "type": "private"},
+            "from": {"id": 1000 + update_id % 500, "is_bot": False, "first_name": "Test"},
+            "text": "📰 Новости",
+        },
+    }
+
+
+async def main(total: int, concurrency: int):
+    handled = 0
+    all_handled = asyncio.Event()
+    dp = Dispatcher()
+
+    @dp.message()
+    async def count_message(message: Message):
+        nonlocal handled
+        await asyncio.sleep(0.01)  # Simulated handler work, e.g. a DB query
+        handled += 1
+        if handled == total:
+            all_handled.set()
+
+    bot = Bot(token="123456:TEST-TOKEN")
+    runner = web.AppRunner(create_webhook_app(dp, bot, PATH, SECRET))
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+
+    url = f"http://{HOST}:{PORT}{PATH}"
+    headers = {"X-Telegram-Bot-Api-Secret-Token": SECRET}
+    queue: asyncio.Queue = asyncio.Queue()
+    for update_id in range(total):
+        queue.put_nowait(update_id)
+
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, json=make_update(0), headers={}) as response:
+            print(f"Request without secret token: HTTP {response.status}")
+
+        async def poster():
+            while not queue.empty():
+                update_id = queue.get_nowait()
+                async with session.post(url, json=make_update(update_id), headers=headers) as r:
+                    assert r.status == 200, r.status
+
+        started = time.perf_counter()
+        await asyncio.gather(*[poster() for _ in range(concurrency)])
+        accepted = time.perf_counter() - started
+        await asyncio.wait_for(all_handled.wait(), timeout=60)
+        processed = time.perf_counter() - started
+
+    print(f"{total} updates, {concurrency} concurrent posters")
+    print(f"  accepted in {accepted:.2f} s ({total / accepted:.0f} updates/s)")
+    print(f"  handled in  {processed:.2f} s ({total / processed:.0f} updates/s)")
+
+    await runner.cleanup()
+    await bot.session.close()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    asyncio.run(main(*(args + [2000, 50][len(args):])))
@@ -0,0 +1,128 @@
+"""Admin commands for managing news sources at runtime."""
+import html
+import json
+import logging
+from typing import Optional, Tuple
+from aiogram import Router, F
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+
+from database import Database
+from config import ADMIN_IDS, FOOTBALL_CLUBS, SOURCES_FILE, SOURCES_RELOAD_SECONDS
+from parsers import create_parser
+from sources import SourceConfig, merge_source_specs
+
+logger = logging.getLogger(__name__)
+router = Router()
+router.message.filter(F.from_user.id.in_(set(ADMIN_IDS)))
+
+# Replies are parsed as HTML, so the <key> / <json> placeholders are escaped
+SOURCES_HELP = html.escape(
+    "/sources - список источников\n"
+    "/source_off <key> - отключить источник\n"
+    "/source_on <key> - включить источник\n"
+    '/source_set <key> <json> - изменить или добавить источник, например {"listing_url": "..."}\n'
+    "/source_reset <key> - сбросить изменения источника"
+)
+
+
+def _applied_note() -> str:
+    return f"Скрейпер применит изменения в течение {SOURCES_RELOAD_SECONDS:.0f} с."
+
+
+def _split_args(command: CommandObject) -> Tuple[Optional[str], Optional[str]]:
+    if not command.args:
+        return None, None
+    key, _, rest = command.args.strip().partition(" ")
+    return key, rest.strip() or None
+
+
+@router.message(Command("sources"))
+async def cmd_sources(message: Message, db: Database):
+    """List effective sources with their state."""
+    source_config = SourceConfig(db, SOURCES_FILE)
+    specs = await source_config.load()
+    overrides = await source_config.get_overrides()
+
+    lines = []
+    for key, spec in specs.items():
+        state = "✅" if spec.get("enabled", True) else "⛔️"
+        mode = spec.get("mode", "html")
+        url = spec.get("feed_url") if mode == "feed" else spec.get("listing_url")
+        mark = " ✏️" if key in overrides else ""
+        lines.append(
+            f"{state} {html.escape(key)} — {html.escape(str(spec.get('name', key)))} "
+            f"({html.escape(str(mode))}){mark}\n    {html.escape(str(url))}"
+        )
+
+    await message.answer("\n".join(lines) + "\n\n" + SOURCES_HELP)
+
+
+async def _set_enabled(message: Message, db: Database, command: CommandObject, enabled: bool):
+    key, _ = _split_args(command)
+    source_config = SourceConfig(db, SOURCES_FILE)
+    if not key or key not in await source_config.load():
+        await message.answer("Неизвестный источник.\n\n" + SOURCES_HELP)
+        return
+
+    await source_config.set_override(key, {"enabled": enabled})
+    logger.info(f"Admin {message.from_user.id} set source {key} enabled={enabled}")
+    state = "включен" if enabled else "отключен"
+    await message.answer(f"Источник {html.escape(key)} {state}. {_applied_note()}")
+
+
+@router.message(Command("source_off"))
+async def cmd_source_off(message: Message, db: Database, command: CommandObject):
+    """Disable a source."""
+    await _set_enabled(message, db, command, enabled=False)
+
+
+@router.message(Command("source_on"))
+async def cmd_source_on(message: Message, db: Database, command: CommandObject):
+    """Enable a source."""
+    await _set_enabled(message, db, command, enabled=True)
+
+
+@router.message(Command("source_set"))
+async def cmd_source_set(message: Message, db: Database, command: CommandObject):
+    """Change fields of a source spec, or add a new source."""
+    key, raw = _split_args(command)
+    if not key or not raw:
+        await message.answer(SOURCES_HELP)
+        return
+
+    try:
+        override = json.loads(raw)
+        if not isinstance(override, dict):
+            raise ValueError("expected a JSON object")
+    except ValueError as e:
+        await message.answer(f"Некорректный JSON: {html.escape(str(e))}")
+        return
+
+    source_config = SourceConfig(db, SOURCES_FILE)
+    specs = merge_source_specs(await source_config.load(), {key: override})
+    try:
+        # Validate selectors and required fields before saving
+        create_parser(key, specs[key], FOOTBALL_CLUBS, http_client=None)
+    except Exception as e:
+        await message.answer(f"Источник {html.escape(key)} не сохранен: {html.escape(str(e))}")
+        return
+
+    await source_config.set_override(key, override)
+    logger.info(f"Admin {message.from_user.id} updated source {key}: {override}")
+    await message.answer(f"Источник {html.escape(key)} обновлен. {_applied_note()}")
+
+
+@router.message(Command("source_reset"))
+async def cmd_source_reset(message: Message, db: Database, command: CommandObject):
+    """Drop admin overrides of a source."""
+    key, _ = _split_args(command)
+    source_config = SourceConfig(db, SOURCES_FILE)
+    if not key or not await source_config.clear_override(key):
+        await message.answer("Для этого источника нет изменений.")
+        return
+
+    logger.info(f"Admin {message.from_user.id} reset source {key}")
+    await message.answer(
+        f"Изменения источника {html.escape(key)} сброшены. {_applied_note()}"
+    )
@@ -1,19 +1,28 @@
 """Handlers for the bot."""
+import html
 import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
 from aiogram import Router, F
-from aiogram.filters import Command
-from aiogram.types import Message, CallbackQuery
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State, StatesGroup
 
 from database import Database
-from config import FOOTBALL_CLUBS, MAX_NEWS_PER_REQUEST
+from config import MAX_NEWS_PER_REQUEST, NEWS_DIGEST_MODE
+from .admin import router as admin_router
 from .keyboards import (
     get_main_keyboard,
     get_clubs_keyboard,
+    get_add_clubs_keyboard,
+    get_add_clubs_page,
     get_clubs_management_keyboard,
     get_confirmation_keyboard,
     get_pagination_keyboard,
 )
+from .rendering import render_cache, take_digest_page
+from .pagination import NEWER, OLDER, news_page_callback, parse_news_page_callback
 from .messages import (
     WELCOME_MESSAGE,
     HELP_MESSAGE,
@@ -28,30 +37,20 @@ from .messages import (
     CLUBS_CLEARED_MESSAGE,
     CLUB_ALREADY_ADDED_MESSAGE,
     ERROR_MESSAGE,
+    SEARCH_PROMPT_MESSAGE,
+    SEARCH_HEADER,
+    SEARCH_NO_RESULTS_MESSAGE,
+    SEARCH_EXPIRED_MESSAGE,
 )
 
 logger = logging.getLogger(__name__)
 router = Router()
 
+SEARCH_PAGE_PREFIX = "search_page"
 
-def format_news_message(news_item) -> str:
-    """Format news item as message."""
-    clubs = (
-        ", ".join(news_item.clubs_mentioned.split(","))
-        if news_item.clubs_mentioned
-        else "—"
-    )
-
-    message = f"📰 <b>{news_item.title}</b>\n\n"
-
-    if news_item.description:
-        message += f"{news_item.description[:200]}...\n\n"
 
-    message += f"⚽️ Клубы: {clubs}\n"
-    message += f"📌 Источник: {news_item.source}\n"
-    message += f"🔗 <a href='{news_item.url}'>Читать полностью</a>"
-
-    return message
+class SearchStates(StatesGroup):
+    waiting_for_query = State()
 
 
 @router.message(Command("start"))
@@ -84,11 +83,12 @@ async def cmd_clubs(message: Message):
 
 
 @router.message(F.text == "➕ Добавить клуб")
-async def add_club_button(message: Message):
+async def add_club_button(message: Message, db: Database):
     """Handle add club button."""
+    user_clubs = await db.get_user_clubs(message.from_user.id)
     await message.answer(
         SELECT_CLUB_MESSAGE,
-        reply_markup=get_clubs_keyboard(FOOTBALL_CLUBS, action="add"),
+        reply_markup=get_add_clubs_keyboard(user_clubs),
     )
 
 
@@ -108,11 +108,23 @@ async def remove_club_button(message: Message, db: Database):
 
 
 @router.callback_query(F.data == "add_club_menu")
-async def callback_add_club_menu(callback: CallbackQuery):
+async def callback_add_club_menu(callback: CallbackQuery, db: Database):
     """Handle add club menu callback."""
+    user_clubs = await db.get_user_clubs(callback.from_user.id)
     await callback.message.edit_text(
         SELECT_CLUB_MESSAGE,
-        reply_markup=get_clubs_keyboard(FOOTBALL_CLUBS, action="add"),
+        reply_markup=get_add_clubs_keyboard(user_clubs),
+    )
+    await callback.answer()
+
+
+@router.callback_query(F.data.startswith("add_clubs_page:"))
+async def callback_add_clubs_page(callback: CallbackQuery, db: Database):
+    """Handle add club catalog page switch."""
+    page = int(callback.data.split(":", 1)[1])
+    user_clubs = await db.get_user_clubs(callback.from_user.id)
+    await callback.message.edit_reply_markup(
+        reply_markup=get_add_clubs_keyboard(user_clubs, page=page)
     )
     await callback.answer()
 
@@ -167,6 +179,14 @@ async def callback_add_club(callback: CallbackQuery, db: Database):
 
     if success:
         await callback.answer(CLUB_ADDED_MESSAGE.format(club_name))
+
+        # Mark the club as followed in the catalog
+        user_clubs.append(club_name)
+        await callback.message.edit_reply_markup(
+            reply_markup=get_add_clubs_keyboard(
+                user_clubs, page=get_add_clubs_page(club_name)
+            )
+        )
     else:
         await callback.answer(ERROR_MESSAGE, show_alert=True)
 
@@ -225,6 +245,18 @@ async def cmd_news(message: Message, db: Database):
         await message.answer(NO_CLUBS_MESSAGE, reply_markup=get_main_keyboard())
         return
 
+    if NEWS_DIGEST_MODE:
+        news_page = await build_news_page(db, user_clubs)
+        if not news_page:
+            await message.answer(NO_NEWS_MESSAGE, reply_markup=get_main_keyboard())
+            return
+
+        text, keyboard = news_page
+        await message.answer(
+            text, parse_mode="HTML", disable_web_page_preview=True, reply_markup=keyboard
+        )
+        return
+
     # Get recent news filtered by user clubs
     news_items = await db.get_recent_news(limit=MAX_NEWS_PER_REQUEST, clubs=user_clubs)
 
@@ -235,14 +267,204 @@ async def cmd_news(message: Message, db: Database):
     # Send news
     await message.answer(NEWS_HEADER)
 
-    for news_item in news_items[:5]:  # Show first 5 news
+    news_items = news_items[:5]  # Show first 5 news
+    for news_text in await render_stories(db, news_items):
         try:
-            news_text = format_news_message(news_item)
             await message.answer(news_text, parse_mode="HTML", disable_web_page_preview=True)
         except Exception as e:
             logger.error(f"Error sending news: {e}")
 
 
+async def render_stories(db: Database, news_items: List) -> List[str]:
+    """Render items with links to other sources of the same story."""
+    sources = await db.get_story_sources([news_item.id for news_item in news_items])
+    return [
+        render_cache.render_story(news_item, sources.get(news_item.id, []))
+        for news_item in news_items
+    ]
+
+
+async def build_news_page(
+    db: Database,
+    user_clubs: List[str],
+    page: int = 0,
+    direction: Optional[str] = None,
+    cursor: Optional[Tuple[datetime, int]] = None,
+) -> Optional[Tuple[str, Optional[InlineKeyboardMarkup]]]:
+    """Build one digest page of the user's news around a keyset cursor.
+
+    A page holds up to MAX_NEWS_PER_REQUEST items, fewer if they would not fit
+    into one Telegram message. Paging buttons carry cursors of the first and
+    last item shown, so every page costs one indexed query.
+    """
+    header = NEWS_HEADER if page == 0 else ""
+    fetch_limit = MAX_NEWS_PER_REQUEST + 1
+
+    if direction == NEWER:
+        # Items come closest to the cursor first; keep those that fit
+        items = await db.get_news_page(user_clubs, fetch_limit, after=cursor)
+        candidates = items[:MAX_NEWS_PER_REQUEST]
+        messages = await render_stories(db, candidates)
+        _, count = take_digest_page(messages, header)
+        shown = list(reversed(candidates[:count]))
+        messages = list(reversed(messages[:count]))
+        has_newer = len(items) > count
+        has_older = True
+    else:
+        items = await db.get_news_page(user_clubs, fetch_limit, before=cursor)
+        candidates = items[:MAX_NEWS_PER_REQUEST]
+        messages = await render_stories(db, candidates)
+        _, count = take_digest_page(messages, header)
+        shown = candidates[:count]
+        messages = messages[:count]
+        has_newer = direction == OLDER
+        has_older = len(items) > count
+
+    if not shown:
+        return None
+
+    text, _ = take_digest_page(messages, header)
+
+    prev_callback = None
+    next_callback = None
+    if has_newer:
+        first = shown[0]
+        prev_callback = news_page_callback(
+            max(page - 1, 0), NEWER, first.created_at, first.id
+        )
+    if has_older:
+        last = shown[-1]
+        next_callback = news_page_callback(page + 1, OLDER, last.created_at, last.id)
+
+    keyboard = None
+    if prev_callback or next_callback:
+        keyboard = get_pagination_keyboard(page, prev_callback, next_callback)
+
+    return text, keyboard
+
+
+@router.callback_query(F.data.startswith("news_page:"))
+async def callback_news_page(callback: CallbackQuery, db: Database):
+    """Handle news page switch by editing the message in place."""
+    try:
+        page, direction, cursor = parse_news_page_callback(callback.data)
+    except ValueError:
+        await callback.answer(ERROR_MESSAGE, show_alert=True)
+        return
+
+    user_clubs = await db.get_user_clubs(callback.from_user.id)
+    news_page = (
+        await build_news_page(db, user_clubs, page, direction, cursor) if user_clubs else None
+    )
+
+    if not news_page:
+        await callback.message.edit_text(NO_NEWS_MESSAGE)
+        await callback.answer()
+        return
+
+    text, keyboard = news_page
+    await callback.message.edit_text(
+        text, parse_mode="HTML", disable_web_page_preview=True, reply_markup=keyboard
+    )
+    await callback.answer()
+
+
+async def build_search_page(
+    db: Database, query: str, page: int, offset: int, prev_offset: Optional[int]
+) -> Optional[Tuple[str, Optional[InlineKeyboardMarkup], int]]:
+    """Build one page of ranked search results starting at ``offset``.
+
+    Returns text, keyboard and the number of items shown, or None.
+    """
+    header = SEARCH_HEADER.format(html.escape(query))
+    items = await db.search_news(query, limit=MAX_NEWS_PER_REQUEST + 1, offset=offset)
+    candidates = items[:MAX_NEWS_PER_REQUEST]
+    if not candidates:
+        return None
+
+    text, count = take_digest_page([render_cache.render(i) for i in candidates], header)
+    has_next = len(items) > count
+
+    prev_callback = (
+        f"{SEARCH_PAGE_PREFIX}:{page - 1}:{prev_offset}" if prev_offset is not None else None
+    )
+    next_callback = f"{SEARCH_PAGE_PREFIX}:{page + 1}:{offset + count}" if has_next else None
+
+    keyboard = None
+    if prev_callback or next_callback:
+        keyboard = get_pagination_keyboard(page, prev_callback, next_callback)
+
+    return text, keyboard, count
+
+
+async def answer_search(message: Message, db: Database, state: FSMContext, query: str):
+    """Run a new search and remember the query for paging."""
+    await state.clear()
+    search_page = await build_search_page(db, query, page=0, offset=0, prev_offset=None)
+    if not search_page:
+        await message.answer(SEARCH_NO_RESULTS_MESSAGE.format(html.escape(query)))
+        return
+
+    # Callback data cannot hold the query, so paging reads it from FSM state
+    await state.update_data(search_query=query, search_offsets=[0])
+    text, keyboard, _ = search_page
+    await message.answer(
+        text, parse_mode="HTML", disable_web_page_preview=True, reply_markup=keyboard
+    )
+
+
+@router.message(Command("search"))
+async def cmd_search(
+    message: Message, db: Database, state: FSMContext, command: CommandObject
+):
+    """Handle /search command, with the query inline or as the next message."""
+    if not command.args or not command.args.strip():
+        await state.set_state(SearchStates.waiting_for_query)
+        await message.answer(SEARCH_PROMPT_MESSAGE)
+        return
+
+    await answer_search(message, db, state, command.args.strip())
+
+
+@router.callback_query(F.data.startswith(f"{SEARCH_PAGE_PREFIX}:"))
+async def callback_search_page(callback: CallbackQuery, db: Database, state: FSMContext):
+    """Handle search results page switch."""
+    data = await state.get_data()
+    query = data.get("search_query")
+    offsets = data.get("search_offsets", [])
+    try:
+        _, page, offset = callback.data.split(":")
+        page, offset = int(page), int(offset)
+    except ValueError:
+        await callback.answer(ERROR_MESSAGE, show_alert=True)
+        return
+
+    if not query or page > len(offsets):
+        await callback.answer(SEARCH_EXPIRED_MESSAGE, show_alert=True)
+        return
+
+    # Offsets of the pages seen so far give the way back
+    offsets = offsets[:page] + [offset]
+    prev_offset = offsets[page - 1] if page > 0 else None
+    search_page = await build_search_page(db, query, page, offset, prev_offset)
+    if not search_page:
+        await callback.answer(SEARCH_EXPIRED_MESSAGE, show_alert=True)
+        return
+
+    await state.update_data(search_offsets=offsets)
+    text, keyboard, _ = search_page
+    await callback.message.edit_text(
+        text, parse_mode="HTML", disable_web_page_preview=True, reply_markup=keyboard
+    )
+    await callback.answer()
+
+
+@router.callback_query(F.data == "current_page")
+async def callback_current_page(callback: CallbackQuery):
+    """Handle tap on the page counter button."""
+    await callback.answer()
+
+
 @router.callback_query(F.data == "back_to_menu")
 async def callback_back_to_menu(callback: CallbackQuery):
     """Handle back to menu callback."""
@@ -261,6 +483,13 @@ async def callback_cancel(callback: CallbackQuery):
     await callback.answer()
 
 
+@router.message(SearchStates.waiting_for_query, F.text, ~F.text.startswith("/"))
+async def search_query_entered(message: Message, db: Database, state: FSMContext):
+    """Handle the search query sent after a bare /search."""
+    await answer_search(message, db, state, message.text.strip())
+
+
 def register_handlers(router_to_include: Router):
     """Register all handlers."""
+    router_to_include.include_router(admin_router)
     router_to_include.include_router(router)
@@ -6,11 +6,15 @@ from aiogram.types import (
     InlineKeyboardButton,
 )
 from aiogram.utils.keyboard import ReplyKeyboardBuilder, InlineKeyboardBuilder
-from typing import List
+from functools import lru_cache
+from typing import Collection, List, Optional, Tuple
 
+from config import FOOTBALL_CLUBS, CLUBS_KEYBOARD_COLUMNS, CLUBS_KEYBOARD_PAGE_SIZE
 
-def get_main_keyboard() -> ReplyKeyboardMarkup:
-    """Get main menu keyboard."""
+# Static markups are built once and shared; they must never be mutated.
+
+
+def _build_main_keyboard() -> ReplyKeyboardMarkup:
     builder = ReplyKeyboardBuilder()
     builder.row(
         KeyboardButton(text="📰 Новости"),
@@ -39,8 +43,7 @@ def get_clubs_keyboard(clubs: List[str], action: str = "add") -> InlineKeyboardM
     return builder.as_markup()
 
 
-def get_clubs_management_keyboard() -> InlineKeyboardMarkup:
-    """Get clubs management keyboard."""
+def _build_clubs_management_keyboard() -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
 
     builder.row(
@@ -60,6 +63,17 @@ def get_clubs_management_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+def get_main_keyboard() -> ReplyKeyboardMarkup:
+    """Get main menu keyboard."""
+    return _MAIN_KEYBOARD
+
+
+def get_clubs_management_keyboard() -> InlineKeyboardMarkup:
+    """Get clubs management keyboard."""
+    return _CLUBS_MANAGEMENT_KEYBOARD
+
+
+@lru_cache(maxsize=16)
 def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
     """Get confirmation keyboard."""
     builder = InlineKeyboardBuilder()
@@ -72,35 +86,124 @@ def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+# One prebuilt page of the "add club" catalog: club button rows as
+# (club, plain button, ✅ button) triples, the static navigation rows and
+# the ready markup used when none of the page's clubs are selected.
+AddClubsPage = Tuple[
+    Tuple[Tuple[Tuple[str, InlineKeyboardButton, InlineKeyboardButton], ...], ...],
+    List[List[InlineKeyboardButton]],
+    InlineKeyboardMarkup,
+]
+
+
+@lru_cache(maxsize=4)
+def _build_add_clubs_pages(
+    clubs: Tuple[str, ...], columns: int, page_size: int
+) -> Tuple[AddClubsPage, ...]:
+    """Build every page of the add-club catalog once."""
+    chunks = [clubs[i:i + page_size] for i in range(0, len(clubs), page_size)] or [()]
+    pages = []
+
+    for number, chunk in enumerate(chunks):
+        rows = tuple(
+            tuple(
+                (
+                    club,
+                    InlineKeyboardButton(text=club, callback_data=f"add_club:{club}"),
+                    InlineKeyboardButton(text=f"✅ {club}", callback_data=f"add_club:{club}"),
+                )
+                for club in chunk[i:i + columns]
+            )
+            for i in range(0, len(chunk), columns)
+        )
+
+        static_rows = []
+        if len(chunks) > 1:
+            nav = []
+            if number > 0:
+                nav.append(
+                    InlineKeyboardButton(
+                        text="⬅️", callback_data=f"add_clubs_page:{number - 1}"
+                    )
+                )
+            nav.append(
+                InlineKeyboardButton(
+                    text=f"{number + 1}/{len(chunks)}", callback_data="current_page"
+                )
+            )
+            if number < len(chunks) - 1:
+                nav.append(
+                    InlineKeyboardButton(
+                        text="➡️", callback_data=f"add_clubs_page:{number + 1}"
+                    )
+                )
+            static_rows.append(nav)
+        static_rows.append(
+            [InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_menu")]
+        )
+
+        markup = InlineKeyboardMarkup(
+            inline_keyboard=[[plain for _, plain, _ in row] for row in rows] + static_rows
+        )
+        pages.append((rows, static_rows, markup))
+
+    return tuple(pages)
+
+
+def get_add_clubs_page(club: str) -> int:
+    """Page of the add-club catalog that shows the club."""
+    try:
+        return FOOTBALL_CLUBS.index(club) // CLUBS_KEYBOARD_PAGE_SIZE
+    except ValueError:
+        return 0
+
+
+def get_add_clubs_keyboard(
+    selected: Collection[str] = (), page: int = 0
+) -> InlineKeyboardMarkup:
+    """Get a page of the add-club catalog with ✅ on clubs the user follows."""
+    pages = _build_add_clubs_pages(
+        tuple(FOOTBALL_CLUBS), CLUBS_KEYBOARD_COLUMNS, CLUBS_KEYBOARD_PAGE_SIZE
+    )
+    rows, static_rows, markup = pages[min(max(page, 0), len(pages) - 1)]
+
+    if not any(club in selected for row in rows for club, _, _ in row):
+        return markup
+
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [marked if club in selected else plain for club, plain, marked in row]
+            for row in rows
+        ]
+        + static_rows
+    )
+
+
 def get_pagination_keyboard(
-    current_page: int, total_pages: int, prefix: str = "news"
+    current_page: int,
+    prev_callback: Optional[str] = None,
+    next_callback: Optional[str] = None,
 ) -> InlineKeyboardMarkup:
-    """Get pagination keyboard."""
+    """Get pagination keyboard with prebuilt callback data for each direction."""
     builder = InlineKeyboardBuilder()
 
     buttons = []
 
-    if current_page > 0:
-        buttons.append(
-            InlineKeyboardButton(
-                text="⬅️ Назад", callback_data=f"{prefix}_page:{current_page - 1}"
-            )
-        )
+    if prev_callback:
+        buttons.append(InlineKeyboardButton(text="⬅️ Назад", callback_data=prev_callback))
 
     buttons.append(
-        InlineKeyboardButton(
-            text=f"{current_page + 1}/{total_pages}", callback_data="current_page"
-        )
+        InlineKeyboardButton(text=f"Стр. {current_page + 1}", callback_data="current_page")
     )
 
-    if current_page < total_pages - 1:
-        buttons.append(
-            InlineKeyboardButton(
-                text="Вперед ➡️", callback_data=f"{prefix}_page:{current_page + 1}"
-            )
-        )
+    if next_callback:
+        buttons.append(InlineKeyboardButton(text="Вперед ➡️", callback_data=next_callback))
 
     builder.row(*buttons)
     builder.row(InlineKeyboardButton(text="◀️ Главное меню", callback_data="back_to_menu"))
 
     return builder.as_markup()
+
+
+_MAIN_KEYBOARD = _build_main_keyboard()
+_CLUBS_MANAGEMENT_KEYBOARD = _build_clubs_management_keyboard()
@@ -19,6 +19,7 @@ HELP_MESSAGE = """
 /start - Начать работу с ботом
 /clubs - Управление клубами
 /news - Получить последние новости
+/search - Поиск по новостям
 /help - Показать эту справку
 
 Выберите команду или используйте кнопки в меню.
@@ -72,3 +73,11 @@ CLUBS_CLEARED_MESSAGE = "🗑 Все клубы удалены из избран
 CLUB_ALREADY_ADDED_MESSAGE = "ℹ️ Клуб «{}» уже в вашем избранном!"
 
 ERROR_MESSAGE = "❌ Произошла ошибка. Попробуйте позже."
+
+SEARCH_PROMPT_MESSAGE = "🔍 Введите слова для поиска, например: трансфер Зенит"
+
+SEARCH_HEADER = "🔍 Результаты поиска «{}»:\n\n"
+
+SEARCH_NO_RESULTS_MESSAGE = "🔍 По запросу «{}» ничего не найдено."
+
+SEARCH_EXPIRED_MESSAGE = "Поиск устарел, повторите запрос командой /search."
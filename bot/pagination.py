@@ -0,0 +1,38 @@
+"""Compact keyset cursors for news paging callbacks."""
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+EPOCH = datetime(1970, 1, 1)
+NEWS_PAGE_PREFIX = "news_page"
+
+# Direction markers: items older than the cursor, or newer than it
+OLDER = "o"
+NEWER = "n"
+
+
+def encode_cursor(created_at: datetime, news_id: int) -> str:
+    """Encode (created_at, id) as hex microseconds and hex id."""
+    micros = (created_at - EPOCH) // timedelta(microseconds=1)
+    return f"{micros:x}.{news_id:x}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    micros, news_id = cursor.split(".", 1)
+    return EPOCH + timedelta(microseconds=int(micros, 16)), int(news_id, 16)
+
+
+def news_page_callback(page: int, direction: str, created_at: datetime, news_id: int) -> str:
+    """Build callback data, well under Telegram's 64-byte limit (~40 bytes)."""
+    return f"{NEWS_PAGE_PREFIX}:{page}:{direction}:{encode_cursor(created_at, news_id)}"
+
+
+def parse_news_page_callback(
+    data: str,
+) -> Tuple[int, Optional[str], Optional[Tuple[datetime, int]]]:
+    """Return (page, direction, cursor); the first page has no cursor."""
+    parts = data.split(":")
+    page = int(parts[1])
+    if len(parts) < 4:
+        return page, None, None
+    return page, parts[2], decode_cursor(parts[3])
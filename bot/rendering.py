@@ -0,0 +1,102 @@
+"""Rendering of news items into Telegram HTML messages."""
+import html
+from collections import OrderedDict
+from typing import List, Tuple
+
+from config import RENDER_CACHE_SIZE
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+DIGEST_SEPARATOR = "\n\n➖➖➖\n\n"
+
+
+def format_news_message(news_item) -> str:
+    """Format news item as message."""
+    clubs = (
+        ", ".join(news_item.clubs_mentioned.split(","))
+        if news_item.clubs_mentioned
+        else "—"
+    )
+
+    message = f"📰 <b>{html.escape(news_item.title)}</b>\n\n"
+
+    if news_item.description:
+        message += f"{html.escape(news_item.description[:200])}...\n\n"
+
+    message += f"⚽️ Клубы: {html.escape(clubs)}\n"
+    message += f"📌 Источник: {html.escape(news_item.source)}\n"
+    message += f'🔗 <a href="{html.escape(news_item.url)}">Читать полностью</a>'
+
+    return message
+
+
+def format_story_sources(sources: List[Tuple[str, str]]) -> str:
+    """Links to other sources reporting the same story."""
+    links = ", ".join(
+        f'<a href="{html.escape(url)}">{html.escape(source)}</a>' for source, url in sources
+    )
+    return f"\n🗞 Также: {links}"
+
+
+class RenderCache:
+    """Bounded LRU of rendered messages keyed by news id."""
+
+    def __init__(self, max_size: int = 2000):
+        self.max_size = max_size
+        self._messages: "OrderedDict[int, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, news_item) -> str:
+        """Return the rendered message, rendering it at most once."""
+        message = self._messages.get(news_item.id)
+        if message is not None:
+            self._messages.move_to_end(news_item.id)
+            self.hits += 1
+            return message
+
+        self.misses += 1
+        message = format_news_message(news_item)
+        self._store(news_item.id, message)
+        return message
+
+    def render_story(self, news_item, sources: List[Tuple[str, str]]) -> str:
+        """Render the first item of a story followed by links to its copies."""
+        message = self.render(news_item)
+        if sources:
+            message += format_story_sources(sources)
+        return message
+
+    def prime(self, news_items):
+        """Pre-render freshly ingested items so the first reader gets a hit."""
+        for news_item in news_items:
+            self._store(news_item.id, format_news_message(news_item))
+
+    def _store(self, news_id: int, message: str):
+        self._messages[news_id] = message
+        self._messages.move_to_end(news_id)
+        while len(self._messages) > self.max_size:
+            self._messages.popitem(last=False)
+
+
+render_cache = RenderCache(max_size=RENDER_CACHE_SIZE)
+
+
+def take_digest_page(
+    messages: List[str], header: str = "", limit: int = TELEGRAM_MESSAGE_LIMIT
+) -> Tuple[str, int]:
+    """Pack leading messages into one page; return it and how many fit.
+
+    At least one message is always taken so paging can make progress.
+    """
+    page = header
+    count = 0
+
+    for message in messages:
+        piece = f"{DIGEST_SEPARATOR}{message}" if count else message
+        if count and len(page) + len(piece) > limit:
+            break
+        page += piece
+        count += 1
+
+    return page, count
+
@@ -0,0 +1,78 @@
+"""Webhook transport: aiohttp server feeding updates to the dispatcher."""
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+
+async def healthcheck(request: web.Request) -> web.Response:
+    """Liveness probe for load balancers and platform health checks."""
+    return web.Response(text="ok")
+
+
+def create_webhook_app(
+    dp: Dispatcher, bot: Bot, path: str, secret_token: str
+) -> web.Application:
+    """Build the aiohttp application serving Telegram updates.
+
+    Requests with a wrong X-Telegram-Bot-Api-Secret-Token are rejected, and
+    updates are handled in background tasks so Telegram gets its 200 at once.
+    """
+    if not secret_token:
+        raise ValueError("A webhook secret token is required")
+
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        secret_token=secret_token,
+        handle_in_background=True,
+    ).register(app, path=path)
+    app.router.add_get("/healthz", healthcheck)
+    return app
+
+
+async def run_webhook(
+    dp: Dispatcher,
+    bot: Bot,
+    base_url: str,
+    path: str,
+    host: str,
+    port: int,
+    secret_token: str,
+):
+    """Serve updates over a webhook until SIGTERM or SIGINT."""
+    app = create_webhook_app(dp, bot, path, secret_token)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host=host, port=port)
+    await site.start()
+    logger.info(f"Webhook server listening on {host}:{port}{path}")
+
+    await bot.set_webhook(
+        url=f"{base_url.rstrip('/')}{path}",
+        secret_token=secret_token,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+    logger.info("Webhook registered with Telegram")
+
+    # docker stop sends SIGTERM; returning lets the caller run its shutdown
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
+
+    try:
+        await stop_event.wait()
+        logger.info("Stop signal received, shutting down webhook server")
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            with suppress(NotImplementedError):
+                loop.remove_signal_handler(sig)
+        await runner.cleanup()
@@ -7,12 +7,94 @@ load_dotenv()
 # Telegram Bot
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 
+# Update transport: "polling" or "webhook"
+BOT_MODE = os.getenv("BOT_MODE", "polling").lower()
+WEBHOOK_BASE_URL = os.getenv("WEBHOOK_BASE_URL", "")  # Public https URL of the app
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/webhook")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+WEBAPP_HOST = os.getenv("WEBAPP_HOST", "0.0.0.0")
+WEBAPP_PORT = int(os.getenv("PORT", os.getenv("WEBAPP_PORT", "8080")))
+
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./news_bot.db")
+SUBSCRIPTION_CACHE_SIZE = int(os.getenv("SUBSCRIPTION_CACHE_SIZE", "10000"))
+SUBSCRIPTION_CACHE_TTL = int(os.getenv("SUBSCRIPTION_CACHE_TTL", "300"))
+
+# Connection pool (SQLite files and PostgreSQL); statement cache is asyncpg only
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+
+# SQLite connection pragmas (WAL and synchronous=NORMAL are always set)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
 
 # Parser settings
 PARSE_INTERVAL_MINUTES = int(os.getenv("PARSE_INTERVAL_MINUTES", "30"))
+# Each source adapts its own poll interval within these bounds
+SOURCE_MIN_INTERVAL_MINUTES = float(os.getenv("SOURCE_MIN_INTERVAL_MINUTES", "2"))
+SOURCE_MAX_INTERVAL_MINUTES = float(os.getenv("SOURCE_MAX_INTERVAL_MINUTES", "60"))
+SOURCE_SCHEDULE_JITTER = float(os.getenv("SOURCE_SCHEDULE_JITTER", "0.1"))
+
+# Process roles: run the scraper inside the bot process, or separately
+# via `python scraper.py` with EMBEDDED_SCRAPER=false for the bot
+EMBEDDED_SCRAPER = os.getenv("EMBEDDED_SCRAPER", "true").lower() == "true"
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "5"))
+# Rows younger than this are left for the next poll: on PostgreSQL concurrent
+# transactions can commit ids out of order, and a lower id committed late
+# would otherwise fall behind the cursor
+OUTBOX_SETTLE_SECONDS = float(os.getenv("OUTBOX_SETTLE_SECONDS", "10"))
 MAX_NEWS_PER_REQUEST = int(os.getenv("MAX_NEWS_PER_REQUEST", "10"))
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "2000"))
+# Send /news as one paged digest message instead of one message per item
+NEWS_DIGEST_MODE = os.getenv("NEWS_DIGEST_MODE", "true").lower() == "true"
+
+# Add-club keyboard layout
+CLUBS_KEYBOARD_COLUMNS = int(os.getenv("CLUBS_KEYBOARD_COLUMNS", "2"))
+CLUBS_KEYBOARD_PAGE_SIZE = int(os.getenv("CLUBS_KEYBOARD_PAGE_SIZE", "20"))
+
+# Push delivery of new articles to subscribers
+DELIVERY_ENABLED = os.getenv("DELIVERY_ENABLED", "true").lower() == "true"
+DELIVERY_WORKERS = int(os.getenv("DELIVERY_WORKERS", "4"))
+DELIVERY_GLOBAL_RATE = float(os.getenv("DELIVERY_GLOBAL_RATE", "25"))
+DELIVERY_PER_CHAT_INTERVAL = float(os.getenv("DELIVERY_PER_CHAT_INTERVAL", "1.0"))
+# Items published longer ago than this are stored but not pushed
+DELIVERY_MAX_AGE_HOURS = float(os.getenv("DELIVERY_MAX_AGE_HOURS", "24"))
+
+# In-memory seen-URL cache in front of news_items
+SEEN_URLS_WINDOW_HOURS = int(os.getenv("SEEN_URLS_WINDOW_HOURS", "72"))
+SEEN_URLS_MAX_SIZE = int(os.getenv("SEEN_URLS_MAX_SIZE", "50000"))
+
+# Near-duplicate stories across sources: lookback window, index bound, MinHash similarity
+STORY_WINDOW_HOURS = int(os.getenv("STORY_WINDOW_HOURS", "48"))
+STORY_INDEX_MAX_SIZE = int(os.getenv("STORY_INDEX_MAX_SIZE", "20000"))
+STORY_SIMILARITY = float(os.getenv("STORY_SIMILARITY", "0.5"))
+
+# Retention: items older than RETENTION_DAYS are archived (if a directory is set)
+# and deleted in batches, then the database is compacted; 0 days disables it
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "90"))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "500"))
+RETENTION_ARCHIVE_DIR = os.getenv("RETENTION_ARCHIVE_DIR", "archive")
+RETENTION_INTERVAL_HOURS = float(os.getenv("RETENTION_INTERVAL_HOURS", "24"))
+RETENTION_VACUUM_PAGES = int(os.getenv("RETENTION_VACUUM_PAGES", "0"))
+
+# HTML parsing runs off the event loop: "process", "thread" or "inline"
+PARSE_EXECUTOR = os.getenv("PARSE_EXECUTOR", "process")
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "2"))
+
+# Listing crawl stops after this many known URLs in a row, or at the page limit
+LISTING_KNOWN_RUN_LIMIT = int(os.getenv("LISTING_KNOWN_RUN_LIMIT", "3"))
+LISTING_MAX_PAGES = int(os.getenv("LISTING_MAX_PAGES", "5"))
+
+# HTTP client settings (shared connection pool for all parsers)
+HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "10"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "20"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "4"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
 
 # Popular football clubs (can be extended)
 FOOTBALL_CLUBS = [
@@ -26,21 +108,76 @@ FOOTBALL_CLUBS = [
     "Аякс", "Бенфика", "Порту"
 ]
 
+# Nicknames and irregular forms per club; single-word entries are also inflected
+CLUB_ALIASES = {
+    "Спартак": ["красно-белые", "красно-белых", "красно-белым"],
+    "ЦСКА": ["армейцы", "армейцев", "армейцам"],
+    "Зенит": ["сине-бело-голубые", "сине-бело-голубых"],
+    "Локомотив": ["Локо", "железнодорожники", "железнодорожников"],
+    "Крылья Советов": [
+        "Крыльев Советов", "Крыльям Советов", "Крыльями Советов", "Крыльях Советов"
+    ],
+    "Реал Мадрид": ["Реал", "сливочные", "сливочных"],
+    "Барселона": ["Барса", "блауграна"],
+    "Манчестер Юнайтед": ["МЮ", "Ман Юнайтед"],
+    "Манчестер Сити": ["Ман Сити"],
+    "Ливерпуль": ["мерсисайдцы", "мерсисайдцев"],
+    "Арсенал": ["канониры", "канониров"],
+    "ПСЖ": ["Пари Сен-Жермен"],
+    "Ювентус": ["Юве", "бьянконери"],
+    "Интер": ["нерадзурри"],
+    "Милан": ["россонери"],
+    "Атлетико": ["матрасники", "матрасников"],
+}
+
 # News sources
+# Optional JSON file with source specs layered over NEWS_SOURCES; re-read on change
+SOURCES_FILE = os.getenv("SOURCES_FILE", "")
+SOURCES_RELOAD_SECONDS = float(os.getenv("SOURCES_RELOAD_SECONDS", "15"))
+
+# Telegram ids allowed to manage sources with /sources and /source_* commands
+ADMIN_IDS = [int(x) for x in os.getenv("ADMIN_IDS", "").split(",") if x.strip()]
+
+# "mode" is "html" (listing page + selectors) or "feed" (RSS/Atom at "feed_url")
 NEWS_SOURCES = {
     "sports_ru": {
         "name": "Sports.ru",
-        "url": "https://www.sports.ru/football/",
-        "enabled": True
+        "base_url": "https://www.sports.ru",
+        "listing_url": "https://www.sports.ru/football/news/",
+        "page_url_template": "https://www.sports.ru/football/news/?page={page}",
+        "mode": "html",
+        "enabled": True,
+        # Селекторы могут меняться, нужно проверить актуальную структуру
+        "selectors": {
+            "item": ".news-item, .item, article",
+            "title": ".title, .news-item-title, h3, h2",
+            "description": ".anons, .description, p",
+        },
     },
     "championat": {
         "name": "Championat.com",
-        "url": "https://www.championat.com/football/",
-        "enabled": True
+        "base_url": "https://www.championat.com",
+        "listing_url": "https://www.championat.com/football/",
+        "feed_url": "https://www.championat.com/rss/news/football/",
+        "mode": "html",
+        "enabled": True,
+        "selectors": {
+            "item": ".article, .news-item, ._item, [class*='article']",
+            "title": "._title, .article-title, .title, h3, h2, a",
+            "description": "._text, .article-text, .description, p",
+        },
     },
     "soccer_ru": {
         "name": "Soccer.ru",
-        "url": "https://soccer.ru/",
-        "enabled": True
-    }
+        "base_url": "https://soccer.ru",
+        "listing_url": "https://soccer.ru/news/",
+        "page_url_template": "https://soccer.ru/news/?page={page}",
+        "mode": "html",
+        "enabled": True,
+        "selectors": {
+            "item": ".news, .article, .item, article, [class*='news']",
+            "title": ".title, h3, h2, a.title",
+            "description": ".text, .description, .anons, p",
+        },
+    },
 }
@@ -1,5 +1,22 @@
 """Database package for the news parser bot."""
 from .database import Database
-from .models import User, UserClub, NewsItem
+from .models import (
+    User,
+    UserClub,
+    NewsItem,
+    NewsClub,
+    NewsDelivery,
+    FetchState,
+    AppState,
+)
 
-__all__ = ["Database", "User", "UserClub", "NewsItem"]
+__all__ = [
+    "Database",
+    "User",
+    "UserClub",
+    "NewsItem",
+    "NewsClub",
+    "NewsDelivery",
+    "FetchState",
+    "AppState",
+]
@@ -0,0 +1,122 @@
+"""Engine construction tuned per database backend, selected from the URL."""
+import logging
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config import (
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_STATEMENT_CACHE_SIZE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB,
+)
+
+logger = logging.getLogger(__name__)
+
+# Plain URLs get the async driver the bot is written for
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def normalize_url(database_url: str) -> URL:
+    """Parse a database URL, switching sync drivers to their async counterpart."""
+    url = make_url(database_url)
+    if url.drivername in _ASYNC_DRIVERS:
+        url = url.set(drivername=_ASYNC_DRIVERS[url.drivername])
+    return url
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def _sqlite_pragmas() -> list:
+    return [
+        # Applies to new files only (it must precede the WAL switch, which writes
+        # the header); existing files keep their mode until an explicit VACUUM
+        "PRAGMA auto_vacuum=INCREMENTAL",
+        # Readers never block the writer and vice versa
+        "PRAGMA journal_mode=WAL",
+        # In WAL mode only a checkpoint needs fsync; safe against corruption
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        # Negative value is in KiB rather than pages
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def _create_sqlite_engine(url: URL) -> AsyncEngine:
+    if _is_sqlite_memory(url):
+        # A memory database lives in its single connection; keep the default pool
+        return create_async_engine(url, echo=False)
+
+    # aiosqlite defaults to NullPool (a new connection and thread per session),
+    # which would also drop the page cache and mmap on every checkout
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+    )
+    pragmas = _sqlite_pragmas()
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def _create_postgres_engine(url: URL) -> AsyncEngine:
+    connect_args = {}
+    if url.get_driver_name() == "asyncpg":
+        # Prepared statements are cached per connection; set 0 behind
+        # pgbouncer in transaction pooling mode
+        connect_args["prepared_statement_cache_size"] = DB_STATEMENT_CACHE_SIZE
+        connect_args["server_settings"] = {"application_name": "footnews-bot"}
+
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=DB_POOL_RECYCLE_SECONDS,
+        connect_args=connect_args,
+    )
+
+
+def create_engine(database_url: str) -> AsyncEngine:
+    """Async engine with connection settings for the backend in ``database_url``.
+
+    SQLite gets WAL journaling and connection pragmas on a reusable pool;
+    PostgreSQL gets a sized, pre-pinged pool and, with asyncpg, a
+    prepared statement cache. Other backends use SQLAlchemy defaults.
+    """
+    url = normalize_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        engine = _create_sqlite_engine(url)
+    elif backend == "postgresql":
+        engine = _create_postgres_engine(url)
+    else:
+        engine = create_async_engine(url, echo=False)
+
+    logger.info(f"Database engine: {url.drivername}, pool {type(engine.pool).__name__}")
+    return engine
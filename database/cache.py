@@ -0,0 +1,64 @@
+"""In-process caches for hot database reads."""
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+class SubscriptionCache:
+    """LRU cache of user club lists keyed by telegram_id, with a TTL."""
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, telegram_id: int) -> Optional[List[str]]:
+        """Return a copy of cached clubs, or None on miss or expiry."""
+        entry = self._entries.get(telegram_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[telegram_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(telegram_id)
+        self.hits += 1
+        return list(entry[1])
+
+    def set(self, telegram_id: int, clubs: List[str]):
+        """Store clubs for user, evicting least recently used entries."""
+        self._entries[telegram_id] = (time.monotonic() + self.ttl, list(clubs))
+        self._entries.move_to_end(telegram_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def apply_change(self, telegram_id: int, club_name: Optional[str], added: bool):
+        """Write a subscription change through to a cached entry."""
+        entry = self._entries.get(telegram_id)
+        if entry is None:
+            return
+
+        expires_at, clubs = entry
+        if club_name is None:
+            clubs = []
+        elif added and club_name not in clubs:
+            clubs = clubs + [club_name]
+        elif not added:
+            clubs = [club for club in clubs if club != club_name]
+        self._entries[telegram_id] = (expires_at, clubs)
+
+    def invalidate(self, telegram_id: int):
+        """Drop the cached entry for user."""
+        self._entries.pop(telegram_id, None)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,33 +1,108 @@
 """Database connection and operations."""
 import logging
-from typing import List, Optional
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import select, delete
-from .models import Base, User, UserClub, NewsItem
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy import and_, delete, func, literal, or_, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .models import (
+    Base,
+    User,
+    UserClub,
+    NewsItem,
+    NewsClub,
+    NewsDelivery,
+    FetchState,
+    AppState,
+)
+from .backends import create_engine
+from .cache import SubscriptionCache
+from .migrations import run_migrations
+from .search import build_fts5_query, search_terms
 
 logger = logging.getLogger(__name__)
 
+# pg_advisory_xact_lock key serializing schema setup across processes
+SCHEMA_LOCK_KEY = 7_301_104
+
+# Called as listener(telegram_id, club_name, added); club_name is None on clear
+SubscriptionListener = Callable[[int, Optional[str], bool], None]
+
 
 class Database:
     """Database manager."""
 
-    def __init__(self, database_url: str):
-        self.engine = create_async_engine(database_url, echo=False)
+    def __init__(
+        self,
+        database_url: str,
+        subscription_cache_size: int = 10000,
+        subscription_cache_ttl: float = 300,
+        engine: Optional[AsyncEngine] = None,
+    ):
+        self.engine = engine or create_engine(database_url)
         self.async_session = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
+        self.subscription_listeners: List[SubscriptionListener] = []
+        self.subscription_cache = SubscriptionCache(
+            max_size=subscription_cache_size, ttl=subscription_cache_ttl
+        )
+        # "tsvector", "fts5" or "like", detected in init_db
+        self.search_backend = "like"
+
+    def add_subscription_listener(self, listener: SubscriptionListener):
+        """Register a callback invoked after user club subscriptions change."""
+        self.subscription_listeners.append(listener)
+
+    def _notify_subscription(self, telegram_id: int, club_name: Optional[str], added: bool):
+        self.subscription_cache.apply_change(telegram_id, club_name, added)
+        for listener in self.subscription_listeners:
+            try:
+                listener(telegram_id, club_name, added)
+            except Exception as e:
+                logger.error(f"Subscription listener error: {e}")
 
     async def init_db(self):
-        """Initialize database tables."""
+        """Initialize database tables.
+
+        The bot and the scraper may start together; the schema is created and
+        migrated under a database-wide lock so only one of them does it.
+        """
         async with self.engine.begin() as conn:
+            if self.engine.dialect.name == "postgresql":
+                # Released when the transaction ends
+                await conn.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY}
+                )
+            elif self.engine.dialect.name == "sqlite":
+                # Take the write lock up front; DDL otherwise runs in autocommit
+                await conn.exec_driver_sql("BEGIN IMMEDIATE")
             await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database initialized")
+            await conn.run_sync(run_migrations)
+
+            if self.engine.dialect.name == "postgresql":
+                self.search_backend = "tsvector"
+            elif self.engine.dialect.name == "sqlite":
+                has_fts = await conn.scalar(
+                    text("SELECT 1 FROM sqlite_master WHERE name = 'news_fts'")
+                )
+                if has_fts:
+                    self.search_backend = "fts5"
+        logger.info(f"Database initialized, search backend: {self.search_backend}")
 
     async def close(self):
         """Close database connection."""
         await self.engine.dispose()
+        logger.info(f"Subscription cache stats: {self.subscription_cache.stats()}")
         logger.info("Database connection closed")
 
+    def _insert(self, model):
+        """Dialect-specific INSERT supporting ON CONFLICT clauses."""
+        if self.engine.dialect.name == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
+
     # User operations
     async def get_or_create_user(
         self,
@@ -36,164 +111,603 @@ class Database:
         first_name: Optional[str] = None,
         last_name: Optional[str] = None,
     ) -> User:
-        """Get existing user or create new one."""
-        async with self.async_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == telegram_id)
-            )
-            user = result.scalar_one_or_none()
-
-            if user:
-                # Update user info
-                user.username = username
-                user.first_name = first_name
-                user.last_name = last_name
-                user.is_active = True
-            else:
-                # Create new user
-                user = User(
-                    telegram_id=telegram_id,
-                    username=username,
-                    first_name=first_name,
-                    last_name=last_name,
-                )
-                session.add(user)
+        """Get existing user or create new one (single upsert).
+
+        A user deactivated after blocking the bot is reactivated, and their
+        clubs are announced to subscription listeners again.
+        """
+        now = datetime.utcnow()
+        previous = select(User.is_active).where(User.telegram_id == telegram_id)
+        if self.engine.dialect.name == "postgresql":
+            # Waits for a concurrent deactivation and reads its result
+            previous = previous.with_for_update()
+        # Materialized and read by the inserted row, so the old state is
+        # captured before the upsert writes; RETURNING reports it
+        previous = previous.cte("previous_user").prefix_with("MATERIALIZED")
+        was_active = previous.select().scalar_subquery()
 
+        stmt = self._insert(User).from_select(
+            [
+                "telegram_id",
+                "username",
+                "first_name",
+                "last_name",
+                "is_active",
+                "created_at",
+                "updated_at",
+            ],
+            select(
+                literal(telegram_id, User.telegram_id.type),
+                literal(username, User.username.type),
+                literal(first_name, User.first_name.type),
+                literal(last_name, User.last_name.type),
+                # Always true; the reference makes SQLite evaluate the CTE here
+                or_(was_active, literal(True)),
+                literal(now),
+                literal(now),
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.telegram_id],
+            set_={
+                "username": stmt.excluded.username,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "is_active": True,
+                "updated_at": now,
+            },
+        ).returning(User, was_active)
+
+        async with self.async_session() as session:
+            result = await session.execute(stmt)
+            user, was_active = result.one()
             await session.commit()
-            await session.refresh(user)
-            return user
+
+        if was_active is False:
+            for club_name in await self.get_user_clubs(telegram_id):
+                self._notify_subscription(telegram_id, club_name, True)
+        return user
 
     async def get_user_clubs(self, telegram_id: int) -> List[str]:
         """Get list of clubs selected by user."""
+        cached = self.subscription_cache.get(telegram_id)
+        if cached is not None:
+            return cached
+
         async with self.async_session() as session:
             result = await session.execute(
-                select(User).where(User.telegram_id == telegram_id)
+                select(UserClub.club_name)
+                .join(User, User.id == UserClub.user_id)
+                .where(User.telegram_id == telegram_id)
+                .order_by(UserClub.id)
             )
-            user = result.scalar_one_or_none()
+            clubs = list(result.scalars().all())
 
-            if not user:
-                return []
-
-            result = await session.execute(
-                select(UserClub).where(UserClub.user_id == user.id)
-            )
-            clubs = result.scalars().all()
-            return [club.club_name for club in clubs]
+        self.subscription_cache.set(telegram_id, clubs)
+        return clubs
 
     async def add_user_club(self, telegram_id: int, club_name: str) -> bool:
-        """Add club to user's selection."""
-        async with self.async_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == telegram_id)
-            )
-            user = result.scalar_one_or_none()
+        """Add club to user's selection.
 
-            if not user:
-                return False
+        Returns False only if the user does not exist; adding a club that is
+        already selected is a no-op guarded by the (user_id, club_name) index.
+        """
+        stmt = self._insert(UserClub).from_select(
+            ["user_id", "club_name", "created_at"],
+            select(User.id, literal(club_name), literal(datetime.utcnow())).where(
+                User.telegram_id == telegram_id
+            ),
+        )
+        # A no-op update makes duplicates count as affected rows
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserClub.user_id, UserClub.club_name],
+            set_={"club_name": stmt.excluded.club_name},
+        )
 
-            # Check if club already exists
-            result = await session.execute(
-                select(UserClub).where(
-                    UserClub.user_id == user.id, UserClub.club_name == club_name
-                )
-            )
-            existing = result.scalar_one_or_none()
+        async with self.async_session() as session:
+            result = await session.execute(stmt)
+            await session.commit()
 
-            if not existing:
-                user_club = UserClub(user_id=user.id, club_name=club_name)
-                session.add(user_club)
-                await session.commit()
+        if result.rowcount == 0:
+            return False
 
-            return True
+        self._notify_subscription(telegram_id, club_name, True)
+        return True
 
     async def remove_user_club(self, telegram_id: int, club_name: str) -> bool:
         """Remove club from user's selection."""
         async with self.async_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == telegram_id)
-            )
-            user = result.scalar_one_or_none()
-
-            if not user:
-                return False
-
             await session.execute(
                 delete(UserClub).where(
-                    UserClub.user_id == user.id, UserClub.club_name == club_name
+                    UserClub.user_id.in_(
+                        select(User.id).where(User.telegram_id == telegram_id)
+                    ),
+                    UserClub.club_name == club_name,
                 )
             )
             await session.commit()
-            return True
+        self._notify_subscription(telegram_id, club_name, False)
+        return True
 
     async def clear_user_clubs(self, telegram_id: int) -> bool:
         """Clear all clubs from user's selection."""
+        async with self.async_session() as session:
+            await session.execute(
+                delete(UserClub).where(
+                    UserClub.user_id.in_(
+                        select(User.id).where(User.telegram_id == telegram_id)
+                    )
+                )
+            )
+            await session.commit()
+        self._notify_subscription(telegram_id, None, False)
+        return True
+
+    async def get_club_subscribers(self) -> Dict[str, Set[int]]:
+        """Map each club to telegram ids of active users following it."""
         async with self.async_session() as session:
             result = await session.execute(
-                select(User).where(User.telegram_id == telegram_id)
+                select(UserClub.club_name, User.telegram_id)
+                .join(User, User.id == UserClub.user_id)
+                .where(User.is_active.is_(True))
             )
-            user = result.scalar_one_or_none()
+            subscribers: Dict[str, Set[int]] = {}
+            for club_name, telegram_id in result.all():
+                subscribers.setdefault(club_name, set()).add(telegram_id)
+            return subscribers
 
-            if not user:
-                return False
+    async def deactivate_user(self, telegram_id: int):
+        """Mark user inactive, e.g. after they blocked the bot."""
+        async with self.async_session() as session:
+            await session.execute(
+                update(User).where(User.telegram_id == telegram_id).values(is_active=False)
+            )
+            await session.commit()
 
-            await session.execute(delete(UserClub).where(UserClub.user_id == user.id))
+    # Delivery operations
+    async def claim_delivery(self, telegram_id: int, news_id: int) -> bool:
+        """Record that news is being sent to user; False if it already was."""
+        async with self.async_session() as session:
+            stmt = (
+                self._insert(NewsDelivery)
+                .from_select(
+                    ["user_id", "news_id", "sent_at"],
+                    select(User.id, literal(news_id), literal(datetime.utcnow())).where(
+                        User.telegram_id == telegram_id
+                    ),
+                )
+                .on_conflict_do_nothing()
+            )
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount > 0
+
+    async def release_delivery(self, telegram_id: int, news_id: int):
+        """Forget a claimed delivery that could not be sent."""
+        async with self.async_session() as session:
+            await session.execute(
+                delete(NewsDelivery).where(
+                    NewsDelivery.news_id == news_id,
+                    NewsDelivery.user_id.in_(
+                        select(User.id).where(User.telegram_id == telegram_id)
+                    ),
+                )
+            )
             await session.commit()
-            return True
 
     # News operations
-    async def add_news_item(
-        self,
-        title: str,
-        url: str,
-        source: str,
-        description: Optional[str] = None,
-        clubs_mentioned: Optional[List[str]] = None,
-    ) -> Optional[NewsItem]:
-        """Add news item to database."""
-        async with self.async_session() as session:
-            # Check if news already exists
-            result = await session.execute(select(NewsItem).where(NewsItem.url == url))
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                return None
-
-            clubs_str = ",".join(clubs_mentioned) if clubs_mentioned else ""
-            news_item = NewsItem(
-                title=title,
-                url=url,
-                source=source,
-                description=description,
-                clubs_mentioned=clubs_str,
-            )
-            session.add(news_item)
+    def _add_news_clubs(self, session: AsyncSession, news_items: List[NewsItem]):
+        """Stage news_clubs index rows for freshly inserted news items."""
+        for news_item in news_items:
+            if not news_item.clubs_mentioned:
+                continue
+            for club in dict.fromkeys(news_item.clubs_mentioned.split(",")):
+                session.add(
+                    NewsClub(
+                        news_id=news_item.id,
+                        club_name=club,
+                        created_at=news_item.created_at,
+                    )
+                )
+
+    async def add_news_items(self, items: List[Dict[str, Any]]) -> List[NewsItem]:
+        """Add a batch of news items in one transaction.
+
+        Each item is a dict with ``title``, ``url`` and ``source`` and optional
+        ``description``, ``clubs_mentioned`` (list), ``published_at``,
+        ``story_id`` and ``backfill``.
+        Known URLs are filtered with a single IN lookup, the rest is written with
+        one multi-row INSERT that ignores URL conflicts. Returns inserted rows.
+        """
+        unique_items = {}
+        for item in items:
+            unique_items.setdefault(item["url"], item)
+
+        if not unique_items:
+            return []
+
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(NewsItem.url).where(NewsItem.url.in_(list(unique_items)))
+            )
+            existing = set(result.scalars().all())
+
+            rows = []
+            for url, item in unique_items.items():
+                if url in existing:
+                    continue
+                clubs_mentioned = item.get("clubs_mentioned")
+                rows.append(
+                    {
+                        "title": item["title"],
+                        "url": url,
+                        "source": item["source"],
+                        "description": item.get("description"),
+                        "clubs_mentioned": (
+                            ",".join(clubs_mentioned) if clubs_mentioned else ""
+                        ),
+                        "published_at": item.get("published_at"),
+                        "story_id": item.get("story_id"),
+                        "backfill": item.get("backfill", False),
+                    }
+                )
+
+            if not rows:
+                return []
+
+            stmt = (
+                self._insert(NewsItem)
+                .on_conflict_do_nothing(index_elements=[NewsItem.url])
+                .returning(NewsItem)
+            )
+            result = await session.scalars(stmt, rows)
+            inserted = list(result.all())
+            self._add_news_clubs(session, inserted)
             await session.commit()
-            await session.refresh(news_item)
-            return news_item
+            return inserted
 
     async def get_recent_news(
         self, limit: int = 50, clubs: Optional[List[str]] = None
     ) -> List[NewsItem]:
-        """Get recent news items, optionally filtered by clubs."""
+        """Get recent news items, one per story, optionally filtered by clubs."""
+        if clubs:
+            return await self.get_news_page(clubs, limit)
+
         async with self.async_session() as session:
-            query = select(NewsItem).order_by(NewsItem.created_at.desc()).limit(limit)
+            query = (
+                select(NewsItem)
+                .where(NewsItem.story_id.is_(None))
+                .order_by(NewsItem.created_at.desc(), NewsItem.id.desc())
+                .limit(limit)
+            )
             result = await session.execute(query)
-            news_items = result.scalars().all()
+            return list(result.scalars().all())
+
+    async def get_news_page(
+        self,
+        clubs: List[str],
+        limit: int,
+        before: Optional[Tuple[datetime, int]] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[NewsItem]:
+        """Keyset-paginate news for clubs by (created_at, id).
+
+        With ``before`` (or no cursor) returns items older than the cursor,
+        newest first. With ``after`` returns items newer than the cursor,
+        closest to the cursor first. Each club reads at most ``limit`` entries
+        of the (club_name, created_at, news_id) index, so the cost depends on
+        the page size and the number of clubs, not on the history length.
+        """
+        if not clubs:
+            return []
+
+        ascending = after is not None
+        cursor = after if ascending else before
+
+        def order(column):
+            return column.asc() if ascending else column.desc()
+
+        per_club = []
+        for club in dict.fromkeys(clubs):
+            query = (
+                select(NewsClub.news_id, NewsClub.created_at)
+                .join(NewsItem, NewsItem.id == NewsClub.news_id)
+                # Later copies of a story are shown as links under its first item
+                .where(NewsClub.club_name == club, NewsItem.story_id.is_(None))
+            )
+            if cursor is not None:
+                created_at, news_id = cursor
+                if ascending:
+                    query = query.where(
+                        or_(
+                            NewsClub.created_at > created_at,
+                            and_(NewsClub.created_at == created_at, NewsClub.news_id > news_id),
+                        )
+                    )
+                else:
+                    query = query.where(
+                        or_(
+                            NewsClub.created_at < created_at,
+                            and_(NewsClub.created_at == created_at, NewsClub.news_id < news_id),
+                        )
+                    )
+            query = query.order_by(order(NewsClub.created_at), order(NewsClub.news_id))
+            per_club.append(select(query.limit(limit).subquery()))
+
+        candidates = union_all(*per_club).subquery()
+        # An item shared by several followed clubs appears once
+        page = (
+            select(candidates.c.news_id, candidates.c.created_at)
+            .distinct()
+            .order_by(order(candidates.c.created_at), order(candidates.c.news_id))
+            .limit(limit)
+            .subquery()
+        )
+
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(NewsItem)
+                .join(page, NewsItem.id == page.c.news_id)
+                .order_by(order(page.c.created_at), order(page.c.news_id))
+            )
+            return list(result.scalars().all())
+
+    async def search_news(
+        self, query: str, limit: int, offset: int = 0, rank_window: int = 5000
+    ) -> List[NewsItem]:
+        """Full-text search over title and description, best matches first.
+
+        Uses the FTS5 index (bm25, title weighted above description) on
+        SQLite and the tsvector GIN index (ts_rank_cd) on PostgreSQL; every
+        query term must match. Only the newest ``rank_window`` matches are
+        ranked, which bounds the cost of very common terms; ties go to newer
+        items.
+        """
+        if self.search_backend == "fts5":
+            match = build_fts5_query(query)
+            if not match:
+                return []
+            statement = text(
+                "SELECT news_items.* FROM ("
+                "SELECT rowid, bm25(news_fts, 10.0, 1.0) AS score FROM news_fts "
+                "WHERE news_fts MATCH :match ORDER BY rowid DESC LIMIT :window"
+                ") AS hits JOIN news_items ON news_items.id = hits.rowid "
+                "ORDER BY hits.score, news_items.id DESC "
+                "LIMIT :limit OFFSET :offset"
+            ).bindparams(match=match, window=rank_window, limit=limit, offset=offset)
+        elif self.search_backend == "tsvector":
+            if not search_terms(query):
+                return []
+            statement = text(
+                "SELECT news_items.* FROM ("
+                "SELECT id, ts_rank_cd(search_vector, query) AS score "
+                "FROM news_items, websearch_to_tsquery('russian', :query) AS query "
+                "WHERE search_vector @@ query ORDER BY id DESC LIMIT :window"
+                ") AS hits JOIN news_items ON news_items.id = hits.id "
+                "ORDER BY hits.score DESC, news_items.id DESC "
+                "LIMIT :limit OFFSET :offset"
+            ).bindparams(query=query, window=rank_window, limit=limit, offset=offset)
+        else:
+            terms = search_terms(query)
+            if not terms:
+                return []
+            async with self.async_session() as session:
+                result = await session.execute(
+                    select(NewsItem)
+                    .where(
+                        *[
+                            or_(
+                                NewsItem.title.ilike(f"%{term}%"),
+                                NewsItem.description.ilike(f"%{term}%"),
+                            )
+                            for term in terms
+                        ]
+                    )
+                    .order_by(NewsItem.created_at.desc(), NewsItem.id.desc())
+                    .limit(limit)
+                    .offset(offset)
+                )
+                return list(result.scalars().all())
+
+        async with self.async_session() as session:
+            result = await session.execute(select(NewsItem).from_statement(statement))
+            return list(result.scalars().all())
+
+    async def get_news_since(self, since: datetime, limit: int) -> List[NewsItem]:
+        """Get news items created after ``since``, oldest first."""
+        async with self.async_session() as session:
+            newest = (
+                select(NewsItem.id)
+                .where(NewsItem.created_at >= since)
+                .order_by(NewsItem.created_at.desc())
+                .limit(limit)
+            )
+            result = await session.execute(
+                select(NewsItem).where(NewsItem.id.in_(newest)).order_by(NewsItem.id.asc())
+            )
+            return list(result.scalars().all())
+
+    async def get_story_sources(self, story_ids: List[int]) -> Dict[int, List[Tuple[str, str]]]:
+        """Get (source, url) of later copies of each story, oldest first."""
+        if not story_ids:
+            return {}
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(NewsItem.story_id, NewsItem.source, NewsItem.url)
+                .where(NewsItem.story_id.in_(story_ids))
+                .order_by(NewsItem.id.asc())
+            )
+            sources: Dict[int, List[Tuple[str, str]]] = {}
+            for story_id, source, url in result.all():
+                sources.setdefault(story_id, []).append((source, url))
+            return sources
+
+    async def get_news_urls_since(self, since: datetime, limit: int) -> List[tuple]:
+        """Get (url, created_at) of the newest items created after ``since``."""
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(NewsItem.url, NewsItem.created_at)
+                .where(NewsItem.created_at >= since)
+                .order_by(NewsItem.created_at.desc())
+                .limit(limit)
+            )
+            return [tuple(row) for row in result.all()]
+
+    async def get_news_after_id(self, after_id: int, limit: int) -> List[NewsItem]:
+        """Get news items with id greater than ``after_id``, oldest first."""
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(NewsItem)
+                .where(NewsItem.id > after_id)
+                .order_by(NewsItem.id.asc())
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+
+    async def get_max_news_id(self) -> int:
+        """Get the id of the newest stored news item, 0 if there is none."""
+        async with self.async_session() as session:
+            result = await session.execute(select(func.max(NewsItem.id)))
+            return result.scalar() or 0
+
+    # Retention operations
+    async def get_news_before(self, cutoff: datetime, limit: int) -> List[NewsItem]:
+        """Get the oldest news items created before ``cutoff``."""
+        async with self.async_session() as session:
+            result = await session.execute(
+                select(NewsItem)
+                .where(NewsItem.created_at < cutoff)
+                .order_by(NewsItem.created_at.asc(), NewsItem.id.asc())
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+
+    async def delete_news_items(self, news_ids: List[int]) -> int:
+        """Delete news items with their club links and deliveries in one transaction.
+
+        Dependent rows are deleted explicitly because SQLite does not enforce
+        ON DELETE CASCADE without the foreign_keys pragma. Surviving copies of
+        a deleted story are regrouped under the oldest of them.
+        """
+        if not news_ids:
+            return 0
+
+        async with self.async_session() as session:
+            copies = await session.execute(
+                select(NewsItem.story_id, NewsItem.id)
+                .where(NewsItem.story_id.in_(news_ids), NewsItem.id.not_in(news_ids))
+                .order_by(NewsItem.id.asc())
+            )
+            new_roots: Dict[int, int] = {}
+            for story_id, news_id in copies.all():
+                if story_id not in new_roots:
+                    new_roots[story_id] = news_id
+                    await session.execute(
+                        update(NewsItem).where(NewsItem.id == news_id).values(story_id=None)
+                    )
+                else:
+                    await session.execute(
+                        update(NewsItem)
+                        .where(NewsItem.id == news_id)
+                        .values(story_id=new_roots[story_id])
+                    )
+
+            await session.execute(delete(NewsClub).where(NewsClub.news_id.in_(news_ids)))
+            await session.execute(
+                delete(NewsDelivery).where(NewsDelivery.news_id.in_(news_ids))
+            )
+            result = await session.execute(delete(NewsItem).where(NewsItem.id.in_(news_ids)))
+            await session.commit()
+            return result.rowcount
+
+    async def get_storage_size(self) -> int:
+        """Bytes used by the database file (SQLite) or the news tables (PostgreSQL)."""
+        async with self.engine.connect() as conn:
+            if self.engine.dialect.name == "sqlite":
+                page_count = await conn.scalar(text("PRAGMA page_count"))
+                page_size = await conn.scalar(text("PRAGMA page_size"))
+                return page_count * page_size
+            if self.engine.dialect.name == "postgresql":
+                return await conn.scalar(
+                    text(
+                        "SELECT pg_total_relation_size('news_items') "
+                        "+ pg_total_relation_size('news_clubs') "
+                        "+ pg_total_relation_size('news_deliveries')"
+                    )
+                )
+            return 0
+
+    async def compact(self, vacuum_pages: int = 0):
+        """Return free pages to the OS and refresh planner statistics.
 
-            if clubs:
-                # Filter by clubs
-                filtered_news = []
-                for item in news_items:
-                    if item.clubs_mentioned:
-                        item_clubs = [c.strip() for c in item.clubs_mentioned.split(",")]
-                        if any(club in item_clubs for club in clubs):
-                            filtered_news.append(item)
-                return filtered_news
+        SQLite runs an incremental vacuum, when the file uses
+        auto_vacuum=INCREMENTAL, and a sampled ANALYZE; PostgreSQL runs
+        VACUUM (ANALYZE) on news tables. ``vacuum_pages`` limits the pages
+        freed per run, 0 frees all. Never rewrites the whole file.
+        """
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            dialect = self.engine.dialect.name
 
-            return list(news_items)
+            if dialect == "sqlite":
+                if await conn.scalar(text("PRAGMA auto_vacuum")) == 2:
+                    await conn.execute(text(f"PRAGMA incremental_vacuum({int(vacuum_pages)})"))
+                else:
+                    logger.info(
+                        "SQLite file is not in incremental auto_vacuum mode, free pages are "
+                        "reused but not returned; convert it with "
+                        "'python retention.py --enable-incremental-vacuum'"
+                    )
+                # Bounds ANALYZE time on large tables by sampling
+                await conn.execute(text("PRAGMA analysis_limit = 1000"))
+                await conn.execute(text("ANALYZE"))
+            elif dialect == "postgresql":
+                await conn.execute(
+                    text("VACUUM (ANALYZE) news_items, news_clubs, news_deliveries")
+                )
+
+    async def enable_incremental_vacuum(self) -> bool:
+        """Switch an existing SQLite file to auto_vacuum=INCREMENTAL.
+
+        Rewrites the whole file with VACUUM under an exclusive lock, so run it
+        once during maintenance. Returns False when nothing had to change.
+        """
+        if self.engine.dialect.name != "sqlite":
+            return False
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            if await conn.scalar(text("PRAGMA auto_vacuum")) == 2:
+                return False
+            await conn.execute(text("PRAGMA auto_vacuum = INCREMENTAL"))
+            await conn.execute(text("VACUUM"))
+            return True
 
-    async def news_exists(self, url: str) -> bool:
-        """Check if news item exists in database."""
+    # Fetch state operations
+    async def get_fetch_states(self) -> List[FetchState]:
+        """Get stored HTTP validators for all source pages."""
         async with self.async_session() as session:
-            result = await session.execute(select(NewsItem).where(NewsItem.url == url))
-            return result.scalar_one_or_none() is not None
+            result = await session.execute(select(FetchState))
+            return list(result.scalars().all())
+
+    async def save_fetch_states(self, states: Dict[str, Dict[str, Optional[str]]]):
+        """Insert or update HTTP validators keyed by URL."""
+        if not states:
+            return
+
+        async with self.async_session() as session:
+            for url, values in states.items():
+                await session.merge(FetchState(url=url, **values))
+            await session.commit()
+
+    # App state operations
+    async def get_app_state(self, key: str) -> Optional[str]:
+        """Get a stored state value."""
+        async with self.async_session() as session:
+            state = await session.get(AppState, key)
+            return state.value if state else None
+
+    async def set_app_state(self, key: str, value: str):
+        """Insert or update a stored state value."""
+        async with self.async_session() as session:
+            await session.merge(AppState(key=key, value=value))
+            await session.commit()
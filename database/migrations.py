@@ -0,0 +1,235 @@
+"""Lightweight schema migrations applied on startup."""
+import logging
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection
+from .models import NewsItem, NewsClub, UserClub
+
+logger = logging.getLogger(__name__)
+
+# Tracking table lives outside Base.metadata so create_all never touches it
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow),
+)
+
+
+def _create_index(
+    conn: Connection,
+    name: str,
+    table: str,
+    columns: List[str],
+    unique: bool = False,
+    where: Optional[str] = None,
+):
+    """Create an index as it was defined when its migration was written.
+
+    create_all does not add indexes to tables that already existed, and the
+    live models may have moved on, so migrations spell out their own DDL.
+    """
+    statement = (
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} "
+        f"ON {table} ({', '.join(columns)})"
+    )
+    if where:
+        statement += f" WHERE {where}"
+    conn.execute(text(statement))
+
+
+def _backfill_news_clubs(conn: Connection):
+    """Fill news_clubs from the comma-separated clubs_mentioned column."""
+    _create_index(conn, "ix_news_items_created_at", "news_items", ["created_at"])
+
+    rows = conn.execute(
+        select(NewsItem.id, NewsItem.clubs_mentioned, NewsItem.created_at).where(
+            NewsItem.clubs_mentioned.is_not(None), NewsItem.clubs_mentioned != ""
+        )
+    ).all()
+
+    links = []
+    for news_id, clubs_mentioned, created_at in rows:
+        clubs = {c.strip() for c in clubs_mentioned.split(",") if c.strip()}
+        for club in clubs:
+            links.append(
+                {
+                    "news_id": news_id,
+                    "club_name": club,
+                    "created_at": created_at or datetime.utcnow(),
+                }
+            )
+
+    if links:
+        conn.execute(NewsClub.__table__.insert(), links)
+    logger.info(f"Backfilled {len(links)} news_clubs rows from {len(rows)} news items")
+
+
+def _dedupe_user_clubs(conn: Connection):
+    """Drop duplicate (user_id, club_name) rows and add the unique index."""
+    keep_ids = select(func.min(UserClub.id)).group_by(UserClub.user_id, UserClub.club_name)
+    result = conn.execute(delete(UserClub).where(UserClub.id.not_in(keep_ids)))
+    logger.info(f"Removed {result.rowcount} duplicate user_clubs rows")
+
+    _create_index(
+        conn, "uq_user_clubs_user_club", "user_clubs", ["user_id", "club_name"], unique=True
+    )
+
+
+def _sqlite_has_fts5(conn: Connection) -> bool:
+    return bool(conn.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar())
+
+
+def _create_search_index(conn: Connection):
+    """Full-text index over news title and description.
+
+    SQLite gets an external-content FTS5 table kept in sync by triggers;
+    PostgreSQL gets a generated tsvector column with a GIN index.
+    """
+    dialect = conn.dialect.name
+
+    if dialect == "postgresql":
+        conn.execute(
+            text(
+                "ALTER TABLE news_items ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                "GENERATED ALWAYS AS ("
+                "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('russian', coalesce(description, '')), 'B')"
+                ") STORED"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_news_items_search_vector "
+                "ON news_items USING GIN (search_vector)"
+            )
+        )
+        return
+
+    if dialect != "sqlite" or not _sqlite_has_fts5(conn):
+        logger.warning(f"No full-text index for {dialect}, search falls back to LIKE")
+        return
+
+    conn.execute(
+        text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5("
+            "title, description, content='news_items', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+    )
+    for statement in (
+        "CREATE TRIGGER IF NOT EXISTS news_items_fts_insert AFTER INSERT ON news_items BEGIN "
+        "INSERT INTO news_fts(rowid, title, description) "
+        "VALUES (new.id, new.title, new.description); END",
+        "CREATE TRIGGER IF NOT EXISTS news_items_fts_delete AFTER DELETE ON news_items BEGIN "
+        "INSERT INTO news_fts(news_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); END",
+        "CREATE TRIGGER IF NOT EXISTS news_items_fts_update "
+        "AFTER UPDATE OF title, description ON news_items BEGIN "
+        "INSERT INTO news_fts(news_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "INSERT INTO news_fts(rowid, title, description) "
+        "VALUES (new.id, new.title, new.description); END",
+    ):
+        conn.execute(text(statement))
+
+    conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
+    logger.info("Built news_fts full-text index")
+
+
+def _add_story_id(conn: Connection):
+    """Add news_items.story_id for near-duplicate story clustering."""
+    columns = {column["name"] for column in inspect(conn).get_columns("news_items")}
+    if "story_id" not in columns:
+        conn.execute(text("ALTER TABLE news_items ADD COLUMN story_id INTEGER"))
+
+    _create_index(conn, "ix_news_items_story_id", "news_items", ["story_id"])
+
+
+def _partial_story_index(conn: Connection):
+    """Recreate the story_id index as partial over story copies only.
+
+    A full index on a column that is almost always NULL lured the planner
+    into "story_id IS NULL" lookups followed by a sort of the whole table
+    on databases without ANALYZE statistics.
+    """
+    conn.execute(text("DROP INDEX IF EXISTS ix_news_items_story_id"))
+    _create_index(
+        conn, "ix_news_items_story_id", "news_items", ["story_id"], where="story_id IS NOT NULL"
+    )
+
+
+def _extend_news_clubs_index(conn: Connection):
+    """Replace the (club_name, created_at) index with one that includes news_id.
+
+    Per-club pages are read in index order, and news_id breaks created_at ties.
+    """
+    conn.execute(text("DROP INDEX IF EXISTS ix_news_clubs_club_created"))
+    _create_index(
+        conn,
+        "ix_news_clubs_club_created_news",
+        "news_clubs",
+        ["club_name", "created_at", "news_id"],
+    )
+
+
+def _widen_telegram_id(conn: Connection):
+    """Store users.telegram_id as a 64-bit integer.
+
+    SQLite integers are already 64-bit, so only PostgreSQL needs the change.
+    """
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("ALTER TABLE users ALTER COLUMN telegram_id TYPE BIGINT"))
+
+
+def _add_backfill_flag(conn: Connection):
+    """Add news_items.backfill to keep first-crawl backlogs out of pushes."""
+    columns = {column["name"] for column in inspect(conn).get_columns("news_items")}
+    if "backfill" not in columns:
+        conn.execute(
+            text("ALTER TABLE news_items ADD COLUMN backfill BOOLEAN NOT NULL DEFAULT FALSE")
+        )
+
+
+# (version, name, migration) in the order they must be applied
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "backfill_news_clubs", _backfill_news_clubs),
+    (2, "dedupe_user_clubs", _dedupe_user_clubs),
+    (3, "create_search_index", _create_search_index),
+    (4, "add_story_id", _add_story_id),
+    (5, "partial_story_index", _partial_story_index),
+    (6, "extend_news_clubs_index", _extend_news_clubs_index),
+    (7, "widen_telegram_id", _widen_telegram_id),
+    (8, "add_backfill_flag", _add_backfill_flag),
+]
+
+
+def run_migrations(conn: Connection):
+    """Apply pending migrations inside the caller's transaction."""
+    schema_migrations.create(conn, checkfirst=True)
+    applied = set(conn.execute(select(schema_migrations.c.version)).scalars().all())
+
+    for version, name, migration in MIGRATIONS:
+        if version in applied:
+            continue
+        logger.info(f"Applying migration {version}: {name}")
+        migration(conn)
+        conn.execute(
+            schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow()
+            )
+        )
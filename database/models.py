@@ -1,7 +1,18 @@
 """Database models for the news parser bot."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Boolean,
+    ForeignKey,
+    Text,
+    Index,
+)
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql import expression
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
@@ -12,7 +23,8 @@ class User(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True)
-    telegram_id = Column(Integer, unique=True, nullable=False, index=True)
+    # Telegram ids no longer fit in 32 bits
+    telegram_id = Column(BigInteger, unique=True, nullable=False, index=True)
     username = Column(String(255), nullable=True)
     first_name = Column(String(255), nullable=True)
     last_name = Column(String(255), nullable=True)
@@ -30,6 +42,9 @@ class User(Base):
 class UserClub(Base):
     """User's selected clubs."""
     __tablename__ = "user_clubs"
+    __table_args__ = (
+        Index("uq_user_clubs_user_club", "user_id", "club_name", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -53,8 +68,83 @@ class NewsItem(Base):
     source = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     published_at = Column(DateTime, nullable=True)
-    clubs_mentioned = Column(Text, nullable=True)  # Comma-separated list of clubs
-    created_at = Column(DateTime, default=datetime.utcnow)
+    clubs_mentioned = Column(Text, nullable=True)  # Display copy; filtering uses news_clubs
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Id of the first item of the same story from another source; None for the first one
+    story_id = Column(Integer, nullable=True)
+    # Stored by a source's first crawl: listed in feeds but never pushed
+    backfill = Column(Boolean, nullable=False, default=False, server_default=expression.false())
+
+    __table_args__ = (
+        # Partial, so "story_id IS NULL" feed queries keep using the created_at index
+        Index(
+            "ix_news_items_story_id",
+            story_id,
+            sqlite_where=story_id.isnot(None),
+            postgresql_where=story_id.isnot(None),
+        ),
+    )
+
+    # Relationships
+    clubs = relationship("NewsClub", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<NewsItem(title={self.title[:50]}, source={self.source})>"
+
+
+class NewsClub(Base):
+    """Club mentioned in a news item (normalized club index)."""
+    __tablename__ = "news_clubs"
+    __table_args__ = (
+        # Covers per-club keyset pages without touching the table
+        Index("ix_news_clubs_club_created_news", "club_name", "created_at", "news_id"),
+    )
+
+    news_id = Column(
+        Integer, ForeignKey("news_items.id", ondelete="CASCADE"), primary_key=True
+    )
+    club_name = Column(String(255), primary_key=True)
+    created_at = Column(DateTime, nullable=False)  # Copy of news_items.created_at
+
+    def __repr__(self):
+        return f"<NewsClub(news_id={self.news_id}, club_name={self.club_name})>"
+
+
+class NewsDelivery(Base):
+    """News item pushed to a user; guards against double delivery."""
+    __tablename__ = "news_deliveries"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    news_id = Column(
+        Integer, ForeignKey("news_items.id", ondelete="CASCADE"), primary_key=True
+    )
+    sent_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<NewsDelivery(user_id={self.user_id}, news_id={self.news_id})>"
+
+
+class FetchState(Base):
+    """HTTP cache validators for a source page, kept across restarts."""
+    __tablename__ = "fetch_states"
+
+    url = Column(String(1000), primary_key=True)
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(255), nullable=True)
+    content_hash = Column(String(64), nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<FetchState(url={self.url}, etag={self.etag})>"
+
+
+class AppState(Base):
+    """Small key-value store for process state such as outbox cursors."""
+    __tablename__ = "app_state"
+
+    key = Column(String(100), primary_key=True)
+    value = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AppState(key={self.key}, value={self.value})>"
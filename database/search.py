@@ -0,0 +1,41 @@
+"""Full-text search query building for the news index."""
+import re
+from typing import List, Optional
+
+_WORD_RE = re.compile(r"\w+")
+
+# Common Russian inflection endings, longest first. SQLite's unicode61
+# tokenizer has no Russian stemmer, so words are cut to a stem and matched
+# as prefixes: "Зенита" and "Зениту" both become зенит*.
+_ENDINGS = sorted(
+    (
+        "иями ями ами ого его ому ему ыми ими ых их ой ей ий ый ая яя ое ее ые ие "
+        "ов ев ам ям ах ях ом ем ую юю а я о е ы и у ю ь й"
+    ).split(),
+    key=len,
+    reverse=True,
+)
+MIN_STEM_LENGTH = 4
+MAX_QUERY_TERMS = 8
+
+
+def search_terms(text: str) -> List[str]:
+    """Lowercased words of a user query, capped in number."""
+    return _WORD_RE.findall(text.lower().replace("ё", "е"))[:MAX_QUERY_TERMS]
+
+
+def stem(word: str) -> str:
+    """Strip one inflection ending while keeping a usable stem."""
+    for ending in _ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+            return word[: -len(ending)]
+    return word
+
+
+def build_fts5_query(text: str) -> Optional[str]:
+    """FTS5 MATCH expression requiring every term, each as a quoted prefix.
+
+    Quoting keeps user input from being read as FTS5 syntax.
+    """
+    terms = [f'"{stem(term)}"*' for term in search_terms(text)]
+    return " ".join(terms) if terms else None
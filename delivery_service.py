@@ -0,0 +1,200 @@
+"""Push delivery of new articles to subscribed users."""
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+
+from bot.rendering import render_cache
+from database import Database, NewsItem
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket limiting how often an action may happen."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class DeliveryService:
+    """Fan out newly ingested news to users following the mentioned clubs.
+
+    Subscriptions are mirrored in an in-memory club -> telegram ids index that
+    follows ``Database`` subscription changes. Matches go onto a queue that a
+    pool of workers drains under a global token bucket and a per-chat interval.
+    Each send is claimed in ``news_deliveries`` first, so restarts and repeated
+    enqueues never send the same item to a user twice.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        db: Database,
+        workers: int = 4,
+        global_rate: float = 25,
+        per_chat_interval: float = 1.0,
+        max_age_hours: float = 24,
+    ):
+        self.bot = bot
+        self.db = db
+        self.workers = workers
+        self.global_bucket = TokenBucket(global_rate)
+        self.per_chat_interval = per_chat_interval
+        self.max_age = timedelta(hours=max_age_hours)
+        self.club_index: Dict[str, Set[int]] = {}
+        self.queue: "asyncio.Queue[Tuple[int, NewsItem]]" = asyncio.Queue()
+        self._chat_next_slot: Dict[int, float] = {}
+        # Queued or in-flight deliveries per news id
+        self._pending: Counter = Counter()
+        self._tasks: List[asyncio.Task] = []
+        self.sent = 0
+        self.skipped = 0
+        self.failed = 0
+
+    async def start(self):
+        """Load the subscription index and start delivery workers."""
+        self.club_index = await self.db.get_club_subscribers()
+        self.db.add_subscription_listener(self.on_subscription_change)
+        self._tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+        subscribers = len(set().union(*self.club_index.values())) if self.club_index else 0
+        logger.info(
+            f"Delivery started: {self.workers} workers, "
+            f"{subscribers} subscribers across {len(self.club_index)} clubs"
+        )
+
+    async def stop(self):
+        """Stop workers; undelivered entries are replayed from the outbox after restart."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(
+            f"Delivery stopped: sent {self.sent}, skipped {self.skipped}, "
+            f"failed {self.failed}, pending {self.queue.qsize()}"
+        )
+
+    def on_subscription_change(self, telegram_id: int, club_name: Optional[str], added: bool):
+        """Keep the club index in sync with user subscription changes."""
+        if added:
+            self.club_index.setdefault(club_name, set()).add(telegram_id)
+        elif club_name is not None:
+            self.club_index.get(club_name, set()).discard(telegram_id)
+        else:
+            for subscribers in self.club_index.values():
+                subscribers.discard(telegram_id)
+
+    def oldest_pending_id(self) -> Optional[int]:
+        """Smallest news id with deliveries still queued or in flight."""
+        return min(self._pending) if self._pending else None
+
+    def enqueue_news(self, news_items: List[NewsItem]):
+        """Queue new items for every subscriber of their clubs; never blocks.
+
+        Later copies of an already stored story are not pushed again, and
+        neither are a source's first-crawl backlog and items published more
+        than ``max_age`` ago.
+        """
+        queued = 0
+        published_after = datetime.utcnow() - self.max_age
+        for news_item in news_items:
+            if not news_item.clubs_mentioned or news_item.story_id or news_item.backfill:
+                continue
+            if news_item.published_at and news_item.published_at < published_after:
+                continue
+            recipients: Set[int] = set()
+            for club in news_item.clubs_mentioned.split(","):
+                recipients |= self.club_index.get(club, set())
+            for telegram_id in recipients:
+                self.queue.put_nowait((telegram_id, news_item))
+            if recipients:
+                self._pending[news_item.id] += len(recipients)
+            queued += len(recipients)
+
+        if queued:
+            logger.info(f"Queued {queued} deliveries for {len(news_items)} news items")
+
+    async def _wait_for_chat(self, telegram_id: int):
+        """Reserve the next send slot for a chat and sleep until it."""
+        now = time.monotonic()
+        slot = max(now, self._chat_next_slot.get(telegram_id, 0))
+        self._chat_next_slot[telegram_id] = slot + self.per_chat_interval
+
+        if len(self._chat_next_slot) > 10000:
+            self._chat_next_slot = {
+                chat: next_slot
+                for chat, next_slot in self._chat_next_slot.items()
+                if next_slot > now
+            }
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _worker(self, number: int):
+        while True:
+            telegram_id, news_item = await self.queue.get()
+            try:
+                await self._deliver(telegram_id, news_item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Delivery worker {number} error: {e}")
+            finally:
+                self._pending[news_item.id] -= 1
+                if self._pending[news_item.id] <= 0:
+                    del self._pending[news_item.id]
+                self.queue.task_done()
+
+    async def _deliver(self, telegram_id: int, news_item: NewsItem):
+        if not await self.db.claim_delivery(telegram_id, news_item.id):
+            self.skipped += 1
+            return
+
+        text = render_cache.render(news_item)
+        while True:
+            await self._wait_for_chat(telegram_id)
+            await self.global_bucket.acquire()
+            try:
+                await self.bot.send_message(
+                    telegram_id, text, parse_mode="HTML", disable_web_page_preview=True
+                )
+                self.sent += 1
+                return
+            except TelegramRetryAfter as e:
+                logger.warning(f"Flood control, retrying in {e.retry_after}s")
+                await asyncio.sleep(e.retry_after)
+            except TelegramForbiddenError:
+                # User blocked the bot: stop sending to them
+                logger.info(f"User {telegram_id} blocked the bot, deactivating")
+                self.on_subscription_change(telegram_id, None, False)
+                await self.db.deactivate_user(telegram_id)
+                return
+            except Exception:
+                await self.db.release_delivery(telegram_id, news_item.id)
+                raise
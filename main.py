@@ -5,12 +5,34 @@ import sys
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from config import TELEGRAM_BOT_TOKEN, DATABASE_URL, PARSE_INTERVAL_MINUTES
+from config import (
+    TELEGRAM_BOT_TOKEN,
+    DATABASE_URL,
+    SUBSCRIPTION_CACHE_SIZE,
+    SUBSCRIPTION_CACHE_TTL,
+    EMBEDDED_SCRAPER,
+    OUTBOX_POLL_SECONDS,
+    OUTBOX_SETTLE_SECONDS,
+    DELIVERY_ENABLED,
+    DELIVERY_WORKERS,
+    DELIVERY_GLOBAL_RATE,
+    DELIVERY_PER_CHAT_INTERVAL,
+    DELIVERY_MAX_AGE_HOURS,
+    BOT_MODE,
+    WEBHOOK_BASE_URL,
+    WEBHOOK_PATH,
+    WEBHOOK_SECRET,
+    WEBAPP_HOST,
+    WEBAPP_PORT,
+)
 from database import Database
 from bot.handlers import register_handlers
-from news_service import NewsService
+from bot.rendering import render_cache
+from bot.webhook import run_webhook
+from delivery_service import DeliveryService
+from news_outbox import NewsOutboxPoller
+from scraper import ScraperWorker
 
 # Configure logging
 logging.basicConfig(
@@ -26,65 +48,79 @@ logger = logging.getLogger(__name__)
 
 # Global variables
 db: Database = None
-news_service: NewsService = None
-scheduler: AsyncIOScheduler = None
-
-
-async def scheduled_news_update():
-    """Scheduled task to update news."""
-    logger.info("Running scheduled news update...")
-    try:
-        new_count = await news_service.update_news()
-        logger.info(f"Scheduled update completed. Added {new_count} new articles.")
-    except Exception as e:
-        logger.error(f"Error in scheduled news update: {e}")
+outbox: NewsOutboxPoller = None
+delivery_service: DeliveryService = None
+scraper: ScraperWorker = None
 
 
 async def on_startup(bot: Bot):
     """Actions on bot startup."""
-    global db, news_service, scheduler
+    global db, outbox, delivery_service, scraper
 
     logger.info("Bot starting up...")
 
     # Initialize database
-    db = Database(DATABASE_URL)
+    db = Database(
+        DATABASE_URL,
+        subscription_cache_size=SUBSCRIPTION_CACHE_SIZE,
+        subscription_cache_ttl=SUBSCRIPTION_CACHE_TTL,
+    )
     await db.init_db()
 
-    # Initialize news service
-    news_service = NewsService(db)
-
-    # Initial news fetch
-    logger.info("Performing initial news fetch...")
-    await news_service.update_news()
-
-    # Setup scheduler for periodic news updates
-    scheduler = AsyncIOScheduler()
-    scheduler.add_job(
-        scheduled_news_update,
-        "interval",
-        minutes=PARSE_INTERVAL_MINUTES,
-        id="news_update",
-    )
-    scheduler.start()
-    logger.info(
-        f"Scheduler started. News will be updated every {PARSE_INTERVAL_MINUTES} minutes."
+    # New items stored by the scraper (in this or another process) arrive here
+    outbox = NewsOutboxPoller(
+        db, interval=OUTBOX_POLL_SECONDS, settle_seconds=OUTBOX_SETTLE_SECONDS
     )
 
+    # Render new items once at ingest; every reader reuses the cached HTML
+    outbox.add_listener(render_cache.prime)
+
+    # Push new articles to subscribers as they are ingested
+    if DELIVERY_ENABLED:
+        delivery_service = DeliveryService(
+            bot,
+            db,
+            workers=DELIVERY_WORKERS,
+            global_rate=DELIVERY_GLOBAL_RATE,
+            per_chat_interval=DELIVERY_PER_CHAT_INTERVAL,
+            max_age_hours=DELIVERY_MAX_AGE_HOURS,
+        )
+        await delivery_service.start()
+        outbox.add_listener(delivery_service.enqueue_news)
+        # Deliveries still queued at shutdown are replayed; claims prevent resends
+        outbox.add_cursor_guard(delivery_service.oldest_pending_id)
+
+    await outbox.start()
+
+    # Single-process deployments scrape in the background of the bot
+    if EMBEDDED_SCRAPER:
+        scraper = ScraperWorker(db)
+        await scraper.start()
+
     logger.info("Bot startup completed!")
 
 
 async def on_shutdown(bot: Bot):
     """Actions on bot shutdown."""
-    global db, scheduler
+    global db, outbox, delivery_service, scraper
 
     logger.info("Bot shutting down...")
 
-    if scheduler:
-        scheduler.shutdown()
-        logger.info("Scheduler stopped")
+    if scraper:
+        await scraper.stop()
+        scraper = None
+
+    if outbox:
+        await outbox.stop()
+        outbox = None
+
+    if delivery_service:
+        await delivery_service.stop()
+        delivery_service = None
 
     if db:
         await db.close()
+        db = None
         logger.info("Database connection closed")
 
     logger.info("Bot shutdown completed!")
@@ -96,6 +132,15 @@ async def main():
         logger.error("TELEGRAM_BOT_TOKEN is not set. Please check your .env file.")
         sys.exit(1)
 
+    if BOT_MODE == "webhook" and not WEBHOOK_BASE_URL:
+        logger.error("WEBHOOK_BASE_URL is required when BOT_MODE=webhook.")
+        sys.exit(1)
+
+    # Without a secret the endpoint would accept updates from anyone
+    if BOT_MODE == "webhook" and not WEBHOOK_SECRET:
+        logger.error("WEBHOOK_SECRET is required when BOT_MODE=webhook.")
+        sys.exit(1)
+
     # Initialize bot and dispatcher
     bot = Bot(
         token=TELEGRAM_BOT_TOKEN,
@@ -106,27 +151,36 @@ async def main():
     # Register handlers
     register_handlers(dp)
 
-    # Pass database to handlers
-    dp["db"] = db
-
-    # Register startup and shutdown handlers
-    dp.startup.register(on_startup)
-    dp.shutdown.register(on_shutdown)
-
-    # Start polling
-    logger.info("Starting bot polling...")
     try:
-        # Update db reference after startup
+        # Startup runs once here; the dispatcher startup hook is not used so
+        # polling does not initialize everything a second time
         await on_startup(bot)
+
+        # Pass database to handlers
         dp["db"] = db
 
-        await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
+        if BOT_MODE == "webhook":
+            logger.info("Starting bot in webhook mode...")
+            await run_webhook(
+                dp,
+                bot,
+                base_url=WEBHOOK_BASE_URL,
+                path=WEBHOOK_PATH,
+                host=WEBAPP_HOST,
+                port=WEBAPP_PORT,
+                secret_token=WEBHOOK_SECRET,
+            )
+        else:
+            logger.info("Starting bot polling...")
+            await bot.delete_webhook()
+            await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
         logger.error(f"Bot error: {e}")
     finally:
         await on_shutdown(bot)
+        await bot.session.close()
 
 
 if __name__ == "__main__":
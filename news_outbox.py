@@ -0,0 +1,135 @@
+"""Notification channel from the scraper worker to the bot process."""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from database import Database, NewsItem
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_CURSOR_KEY = "outbox_news_id"
+
+
+class NewsOutboxPoller:
+    """Follow news_items by id and hand newly stored rows to listeners.
+
+    The scraper may run in another process, so the table itself serves as the
+    outbox: the bot polls for ids past its cursor, which is persisted in
+    app_state so items stored while the bot was down are still picked up.
+    Works the same on SQLite and Postgres.
+
+    Ids are allocated when a row is inserted, not when it commits, so a slow
+    transaction can make a lower id visible after a higher one. The cursor
+    only passes rows older than ``settle_seconds`` and stops at the first
+    younger one, giving earlier inserts that long to commit.
+
+    Cursor guards report the oldest id a listener has not finished with; the
+    persisted cursor stays below it, so work still queued at shutdown is
+    replayed on the next start.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        interval: float = 5.0,
+        batch_size: int = 200,
+        settle_seconds: float = 10.0,
+    ):
+        self.db = db
+        self.interval = interval
+        self.batch_size = batch_size
+        self.settle = timedelta(seconds=settle_seconds)
+        self.last_id = 0
+        self.listeners: List[Callable[[List[NewsItem]], None]] = []
+        self.cursor_guards: List[Callable[[], Optional[int]]] = []
+        self._saved_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def add_listener(self, listener: Callable[[List[NewsItem]], None]):
+        """Register a callback receiving each batch of new news items."""
+        self.listeners.append(listener)
+
+    def add_cursor_guard(self, guard: Callable[[], Optional[int]]):
+        """Register a callback returning the oldest news id still being processed."""
+        self.cursor_guards.append(guard)
+
+    async def save_cursor(self):
+        """Persist the cursor, held back before ids that guards still process."""
+        cursor = self.last_id
+        for guard in self.cursor_guards:
+            pending_id = guard()
+            if pending_id is not None:
+                cursor = min(cursor, pending_id - 1)
+        if cursor != self._saved_id:
+            await self.db.set_app_state(OUTBOX_CURSOR_KEY, str(cursor))
+            self._saved_id = cursor
+
+    async def start(self):
+        """Restore the cursor and start polling in the background."""
+        stored = await self.db.get_app_state(OUTBOX_CURSOR_KEY)
+        if stored is not None:
+            self.last_id = int(stored)
+            self._saved_id = self.last_id
+        else:
+            # First run: do not replay the whole history
+            self.last_id = await self.db.get_max_news_id()
+            await self.save_cursor()
+
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"News outbox polling every {self.interval}s from id {self.last_id}")
+
+    async def stop(self):
+        """Stop polling and persist the cursor; call before stopping listeners."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.save_cursor()
+        except Exception as e:
+            logger.error(f"Error saving news outbox cursor: {e}")
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"News outbox poll error: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def poll_once(self) -> int:
+        """Deliver settled items past the cursor to listeners; return their count."""
+        total = 0
+        while True:
+            fetched = await self.db.get_news_after_id(self.last_id, self.batch_size)
+            settled_before = datetime.utcnow() - self.settle
+            news_items = []
+            for news_item in fetched:
+                if news_item.created_at > settled_before:
+                    break
+                news_items.append(news_item)
+            if not news_items:
+                break
+
+            for listener in self.listeners:
+                try:
+                    listener(news_items)
+                except Exception as e:
+                    logger.error(f"News outbox listener error: {e}")
+
+            self.last_id = news_items[-1].id
+            await self.save_cursor()
+            total += len(news_items)
+
+            if len(news_items) < self.batch_size:
+                break
+
+        # Advances the saved cursor as queued work drains
+        await self.save_cursor()
+
+        if total:
+            logger.info(f"News outbox picked up {total} new items")
+        return total
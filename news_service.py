@@ -1,72 +1,510 @@
 """News fetching service."""
 import logging
 import asyncio
-from typing import List
-from database import Database
-from parsers import SportsRuParser, ChampionatParser, SoccerRuParser
-from parsers.base_parser import NewsArticle
-from config import FOOTBALL_CLUBS
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+from database import Database, NewsItem
+from parsers import HttpClient, FetchValidators, ParserRegistry
+from parsers.executor import run_in_parse_executor, shutdown_parse_executor
+from parsers.base_parser import BaseParser, NewsArticle
+from sources import SourceConfig
+from story_index import StoryIndex, signatures_for
+from config import (
+    FOOTBALL_CLUBS,
+    SOURCES_FILE,
+    SOURCES_RELOAD_SECONDS,
+    HTTP_TIMEOUT_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    SEEN_URLS_WINDOW_HOURS,
+    SEEN_URLS_MAX_SIZE,
+    PARSE_INTERVAL_MINUTES,
+    SOURCE_MIN_INTERVAL_MINUTES,
+    SOURCE_MAX_INTERVAL_MINUTES,
+    SOURCE_SCHEDULE_JITTER,
+    STORY_WINDOW_HOURS,
+    STORY_INDEX_MAX_SIZE,
+    STORY_SIMILARITY,
+)
 
 logger = logging.getLogger(__name__)
 
+# Rows per signature task when warming the story index
+STORY_WARM_CHUNK = 1000
+
+
+class SeenUrlCache:
+    """Bounded set of recently stored URLs, expired by age and size."""
+
+    def __init__(self, window: timedelta, max_size: int):
+        self.window = window
+        self.max_size = max_size
+        self._urls: "OrderedDict[str, datetime]" = OrderedDict()
+        self.hits = 0
+        self.lookups = 0
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def check(self, url: str) -> bool:
+        """Look up URL and record the hit/miss for the hit-rate metric."""
+        self.lookups += 1
+        if url in self._urls:
+            self.hits += 1
+            return True
+        return False
+
+    def add(self, url: str, seen_at: Optional[datetime] = None):
+        """Remember URL, evicting the oldest entries beyond the bounds."""
+        seen_at = seen_at or datetime.utcnow()
+        self._urls[url] = seen_at
+        self._urls.move_to_end(url)
+        self._evict()
+
+    def urls_with_prefix(self, prefix: str) -> Set[str]:
+        """Remembered URLs under a source base URL, for incremental parsing."""
+        return {url for url in self._urls if url.startswith(prefix)}
+
+    def add_many(self, urls: Iterable[str]):
+        """Remember several URLs seen now."""
+        now = datetime.utcnow()
+        for url in urls:
+            self._urls[url] = now
+            self._urls.move_to_end(url)
+        self._evict()
+
+    def _evict(self):
+        cutoff = datetime.utcnow() - self.window
+        while self._urls:
+            url, seen_at = next(iter(self._urls.items()))
+            if len(self._urls) <= self.max_size and seen_at >= cutoff:
+                break
+            self._urls.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class SourceSchedule:
+    """Adaptive poll interval and run statistics for one source.
+
+    The interval shrinks while a source keeps yielding new URLs and grows while
+    it yields nothing; errors and non-200 responses back off exponentially.
+    """
+
+    def __init__(
+        self,
+        parser: BaseParser,
+        interval: float,
+        min_interval: float,
+        max_interval: float,
+        jitter: float = 0.1,
+    ):
+        self.parser = parser
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.lock = asyncio.Lock()
+        self.next_run: Optional[datetime] = None
+        self.runs = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.new_items = 0
+        self.last_yield = 0
+
+    def record_run(self, new_count: int, failed: bool):
+        """Adapt the interval to the outcome of a run."""
+        self.runs += 1
+        self.last_yield = new_count
+
+        if failed:
+            self.errors += 1
+            self.consecutive_errors += 1
+            self.interval *= 2
+        else:
+            self.consecutive_errors = 0
+            self.new_items += new_count
+            self.interval *= 0.75 if new_count else 1.25
+
+        self.interval = min(self.max_interval, max(self.min_interval, self.interval))
+
+    def next_delay(self) -> float:
+        """Seconds until the next run, with jitter to spread requests."""
+        delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.next_run = datetime.utcnow() + timedelta(seconds=delay)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-source metrics for logging and monitoring."""
+        return {
+            "interval_minutes": round(self.interval / 60, 1),
+            "next_run": self.next_run.isoformat(timespec="seconds") if self.next_run else None,
+            "runs": self.runs,
+            "new_items": self.new_items,
+            "last_yield": self.last_yield,
+            "errors": self.errors,
+            "skipped_unchanged": self.parser.skipped_runs,
+        }
+
 
 class NewsService:
     """Service for fetching and managing news."""
 
     def __init__(self, db: Database):
         self.db = db
-        self.parsers = [
-            SportsRuParser(clubs=FOOTBALL_CLUBS),
-            ChampionatParser(clubs=FOOTBALL_CLUBS),
-            SoccerRuParser(clubs=FOOTBALL_CLUBS),
-        ]
+        self.http_client = HttpClient(
+            timeout=HTTP_TIMEOUT_SECONDS,
+            connect_timeout=HTTP_CONNECT_TIMEOUT_SECONDS,
+            pool_limit=HTTP_POOL_LIMIT,
+            pool_limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            dns_cache_ttl=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+        self.source_config = SourceConfig(db, SOURCES_FILE)
+        self.registry = ParserRegistry(FOOTBALL_CLUBS, self.http_client)
+        self.seen_urls = SeenUrlCache(
+            window=timedelta(hours=SEEN_URLS_WINDOW_HOURS),
+            max_size=SEEN_URLS_MAX_SIZE,
+        )
+        self.schedules: Dict[str, SourceSchedule] = {}
+        self._schedule_tasks: Dict[str, asyncio.Task] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+        self.story_index = StoryIndex(
+            window=timedelta(hours=STORY_WINDOW_HOURS),
+            max_size=STORY_INDEX_MAX_SIZE,
+            threshold=STORY_SIMILARITY,
+        )
+        self._store_lock = asyncio.Lock()
+        self._warm_task: Optional[asyncio.Task] = None
+
+    @property
+    def parsers(self) -> List[BaseParser]:
+        """Parsers of the currently enabled sources."""
+        return list(self.registry.parsers.values())
+
+    async def start(self):
+        """Load sources and persisted state needed before the first update.
+
+        The story index is warmed in the background; inserts wait for it.
+        """
+        await self.reload_sources()
+        await self.load_fetch_state()
+        await self.warm_seen_urls()
+        self._warm_task = asyncio.create_task(self.warm_story_index())
+
+    async def warm_seen_urls(self):
+        """Fill the seen-URL cache from recently stored news."""
+        started = time.perf_counter()
+        since = datetime.utcnow() - self.seen_urls.window
+        rows = await self.db.get_news_urls_since(since, limit=self.seen_urls.max_size)
+
+        # Rows come newest first; insert oldest first to keep eviction order
+        for url, created_at in reversed(rows):
+            self.seen_urls.add(url, created_at)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Seen-URL cache warmed with {len(self.seen_urls)} URLs in {elapsed_ms:.1f} ms"
+        )
+
+    async def warm_story_index(self):
+        """Index recently stored news so duplicates across a restart are caught.
+
+        MinHash costs about a millisecond per item, so signatures are computed
+        in the parse executor; the store lock keeps inserts from running
+        against a half-filled index.
+        """
+        started = time.perf_counter()
+        async with self._store_lock:
+            try:
+                since = datetime.utcnow() - self.story_index.window
+                news_items = await self.db.get_news_since(
+                    since, limit=self.story_index.max_size
+                )
+                chunks = [
+                    news_items[i:i + STORY_WARM_CHUNK]
+                    for i in range(0, len(news_items), STORY_WARM_CHUNK)
+                ]
+                signatures = await asyncio.gather(
+                    *[
+                        run_in_parse_executor(
+                            signatures_for,
+                            [(news_item.title, news_item.description) for news_item in chunk],
+                        )
+                        for chunk in chunks
+                    ]
+                )
+            except Exception as e:
+                logger.error(f"Error warming story index: {e}")
+                return
 
-    async def fetch_all_news(self) -> List[NewsArticle]:
-        """Fetch news from all sources."""
-        all_news = []
+            for chunk, chunk_signatures in zip(chunks, signatures):
+                for news_item, signature in zip(chunk, chunk_signatures):
+                    if signature is not None:
+                        self.story_index.add(
+                            news_item.id,
+                            news_item.story_id or news_item.id,
+                            news_item.source,
+                            signature,
+                            (news_item.clubs_mentioned or "").split(","),
+                            news_item.created_at,
+                        )
 
-        logger.info("Starting news fetch from all sources...")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Story index warmed with {len(self.story_index)} items in {elapsed_ms:.1f} ms"
+        )
 
-        # Run all parsers in parallel
-        tasks = [parser.parse() for parser in self.parsers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def load_fetch_state(self):
+        """Restore conditional GET validators saved by a previous run."""
+        states = await self.db.get_fetch_states()
+        self.http_client.load_validators(
+            {
+                state.url: FetchValidators(
+                    etag=state.etag,
+                    last_modified=state.last_modified,
+                    content_hash=state.content_hash,
+                )
+                for state in states
+            }
+        )
+        logger.info(f"Loaded fetch validators for {len(states)} source pages")
 
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Parser error: {result}")
-            elif isinstance(result, list):
-                all_news.extend(result)
+    async def save_fetch_state(self):
+        """Persist validators that changed during the last fetch."""
+        changed = self.http_client.pop_dirty_validators()
+        await self.db.save_fetch_states(
+            {
+                url: {
+                    "etag": validators.etag,
+                    "last_modified": validators.last_modified,
+                    "content_hash": validators.content_hash,
+                }
+                for url, validators in changed.items()
+            }
+        )
 
-        logger.info(f"Fetched total {len(all_news)} news articles")
-        return all_news
+    def get_source_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source schedule, yield and unchanged-page skip metrics."""
+        return {name: schedule.stats() for name, schedule in self.schedules.items()}
 
-    async def update_news(self):
-        """Fetch and save new news to database."""
-        try:
-            news_articles = await self.fetch_all_news()
+    async def reload_sources(self) -> Dict[str, List[str]]:
+        """Rebuild parsers from the effective source config.
 
+        Added sources get a fresh schedule (started right away if scheduling
+        is running), removed ones have their loop cancelled, and updated ones
+        keep their adaptive interval with the new parser.
+        """
+        specs = await self.source_config.load()
+        changes = self.registry.apply(specs)
+
+        for key in changes["removed"]:
+            self.schedules.pop(key, None)
+            task = self._schedule_tasks.pop(key, None)
+            if task:
+                task.cancel()
+
+        for key in changes["updated"]:
+            self.schedules[key].parser = self.registry.parsers[key]
+
+        for key in changes["added"]:
+            self.schedules[key] = SourceSchedule(
+                self.registry.parsers[key],
+                interval=PARSE_INTERVAL_MINUTES * 60,
+                min_interval=SOURCE_MIN_INTERVAL_MINUTES * 60,
+                max_interval=SOURCE_MAX_INTERVAL_MINUTES * 60,
+                jitter=SOURCE_SCHEDULE_JITTER,
+            )
+            if self._watch_task:
+                self._start_schedule(key)
+
+        if any(changes.values()):
+            logger.info(f"Sources reloaded: {changes}")
+        return changes
+
+    async def _watch_sources(self):
+        while True:
+            await asyncio.sleep(SOURCES_RELOAD_SECONDS)
+            try:
+                if await self.source_config.changed():
+                    await self.reload_sources()
+            except Exception as e:
+                logger.error(f"Error reloading sources: {e}")
+
+    def _start_schedule(self, key: str):
+        self._schedule_tasks[key] = asyncio.create_task(
+            self._run_schedule(self.schedules[key])
+        )
+
+    def start_scheduling(self):
+        """Poll every source on its own adaptive schedule, first run right away.
+
+        The source config is re-checked every ``SOURCES_RELOAD_SECONDS`` so
+        sources can be added, disabled or changed without a restart.
+        """
+        for key in self.schedules:
+            self._start_schedule(key)
+        self._watch_task = asyncio.create_task(self._watch_sources())
+        logger.info(f"Per-source scheduling started for {len(self.schedules)} sources")
+
+    async def stop_scheduling(self):
+        """Cancel per-source schedule loops and the source watcher."""
+        tasks = list(self._schedule_tasks.values())
+        if self._watch_task:
+            tasks.append(self._watch_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._schedule_tasks = {}
+        self._watch_task = None
+
+    async def _run_schedule(self, schedule: SourceSchedule):
+        while True:
+            await self.update_source(schedule.parser)
+            delay = schedule.next_delay()
+            logger.info(
+                f"{schedule.parser.source_name}: next run in {delay / 60:.1f} min, "
+                f"stats {schedule.stats()}, seen-URL cache {len(self.seen_urls)} URLs "
+                f"with hit rate {self.seen_urls.hit_rate:.1%}"
+            )
+            await asyncio.sleep(delay)
+
+    async def update_source(self, parser: BaseParser) -> int:
+        """Fetch and store news from one source; runs never overlap per source."""
+        schedule = self.schedules[parser.key]
+        if schedule.lock.locked():
+            logger.info(f"{parser.source_name}: previous run still in progress, skipping")
+            return 0
+
+        async with schedule.lock:
             new_count = 0
-            for article in news_articles:
-                # Check if news already exists
-                exists = await self.db.news_exists(article.url)
-
-                if not exists:
-                    # Add new news to database
-                    result = await self.db.add_news_item(
-                        title=article.title,
-                        url=article.url,
-                        source=article.source,
-                        description=article.description,
-                        clubs_mentioned=article.clubs_mentioned,
+            try:
+                known_urls = self.seen_urls.urls_with_prefix(parser.base_url)
+                articles = await parser.parse(known_urls)
+                # A source with nothing seen in the window is crawled for the
+                # first time (or after a long outage): its listing is backlog
+                backfill = not known_urls
+                new_count = len(await self.store_articles(articles, backfill=backfill))
+                if backfill and new_count:
+                    logger.info(
+                        f"{parser.source_name}: first crawl stored {new_count} items without push"
                     )
+                # Pages count as processed only once their articles are stored
+                validators = parser.pop_pending_validators()
+                if not parser.last_error:
+                    self.http_client.commit_validators(validators)
+                    await self.save_fetch_state()
+            except Exception as e:
+                parser.last_error = str(e)
+                logger.error(f"Error updating {parser.source_name}: {e}")
 
-                    if result:
-                        new_count += 1
-                        logger.info(f"Added new news: {article.title[:50]}...")
-
-            logger.info(f"News update completed. Added {new_count} new articles")
+            schedule.record_run(new_count, failed=parser.last_run_failed)
             return new_count
 
-        except Exception as e:
-            logger.error(f"Error updating news: {e}")
-            return 0
+    async def close(self):
+        """Release network and parsing resources held by the service."""
+        await self.stop_scheduling()
+        if self._warm_task:
+            self._warm_task.cancel()
+            await asyncio.gather(self._warm_task, return_exceptions=True)
+            self._warm_task = None
+        await self.http_client.close()
+        shutdown_parse_executor()
+
+    async def store_articles(
+        self, news_articles: List[NewsArticle], backfill: bool = False
+    ) -> List[NewsItem]:
+        """Save new articles mentioning tracked clubs.
+
+        URLs of articles without club mentions are remembered as seen too, so
+        the next incremental parse stops at them instead of re-extracting.
+        Near-duplicates of a story stored in the last ``STORY_WINDOW_HOURS``
+        are saved with its ``story_id``. ``backfill`` items are never pushed.
+        """
+        # Already-known URLs never reach the database
+        fresh = [
+            article for article in news_articles if not self.seen_urls.check(article.url)
+        ]
+        news_articles = [article for article in fresh if article.clubs_mentioned]
+
+        inserted = []
+        if news_articles:
+            # Sources run concurrently; one story must not get two first items
+            async with self._store_lock:
+                inserted = await self._insert_with_stories(news_articles, backfill)
+
+        # Every fresh URL is now either stored or known to be irrelevant
+        self.seen_urls.add_many(article.url for article in fresh)
+
+        for news_item in inserted:
+            logger.info(f"Added new news: {news_item.title[:50]}...")
+
+        return inserted
+
+    async def _insert_with_stories(
+        self, news_articles: List[NewsArticle], backfill: bool
+    ) -> List[NewsItem]:
+        """Insert articles, linking near-duplicates to their indexed story.
+
+        Signatures are computed in the parse executor in one task per batch.
+        """
+        signatures = await run_in_parse_executor(
+            signatures_for,
+            [(article.title, article.description) for article in news_articles],
+        )
+        rows = []
+        # Sources joining each story in this batch, one item per source
+        joined_sources: Dict[int, Set[str]] = {}
+
+        for article, signature in zip(news_articles, signatures):
+            row = {
+                "title": article.title,
+                "url": article.url,
+                "source": article.source,
+                "description": article.description,
+                "clubs_mentioned": article.clubs_mentioned,
+                "published_at": article.published_at,
+                "backfill": backfill,
+            }
+            rows.append(row)
+            if signature is None:
+                continue
+
+            story_id = self.story_index.find_story(
+                signature, article.clubs_mentioned, article.source
+            )
+            if story_id is not None and article.source not in joined_sources.get(story_id, ()):
+                joined_sources.setdefault(story_id, set()).add(article.source)
+                row["story_id"] = story_id
+
+        inserted = await self.db.add_news_items(rows)
+
+        signatures_by_url = {
+            article.url: signature for article, signature in zip(news_articles, signatures)
+        }
+        for news_item in inserted:
+            signature = signatures_by_url.get(news_item.url)
+            if signature is not None:
+                self.story_index.add(
+                    news_item.id,
+                    news_item.story_id or news_item.id,
+                    news_item.source,
+                    signature,
+                    news_item.clubs_mentioned.split(","),
+                )
+
+        duplicates = sum(1 for news_item in inserted if news_item.story_id)
+        if duplicates:
+            logger.info(f"Linked {duplicates} of {len(inserted)} new items to existing stories")
+        return inserted
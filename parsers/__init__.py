@@ -1,6 +1,14 @@
 """Parsers package for various news sources."""
-from .sports_ru import SportsRuParser
-from .championat import ChampionatParser
-from .soccer_ru import SoccerRuParser
+from .selector_parser import SelectorParser
+from .feed_parser import FeedParser
+from .registry import ParserRegistry, create_parser
+from .http_client import HttpClient, FetchValidators
 
-__all__ = ["SportsRuParser", "ChampionatParser", "SoccerRuParser"]
+__all__ = [
+    "SelectorParser",
+    "FeedParser",
+    "ParserRegistry",
+    "create_parser",
+    "HttpClient",
+    "FetchValidators",
+]
@@ -1,9 +1,14 @@
 """Base parser class for news sources."""
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-import aiohttp
-from bs4 import BeautifulSoup
+from datetime import datetime
+from typing import AbstractSet, Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+import lxml.html
+from config import LISTING_KNOWN_RUN_LIMIT, LISTING_MAX_PAGES
+from .club_matcher import get_club_matcher
+from .executor import run_in_parse_executor
+from .http_client import FetchValidators, HttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -18,60 +23,242 @@ class NewsArticle:
         source: str,
         description: Optional[str] = None,
         clubs_mentioned: Optional[List[str]] = None,
+        published_at: Optional[datetime] = None,
     ):
         self.title = title
         self.url = url
         self.source = source
         self.description = description
         self.clubs_mentioned = clubs_mentioned or []
+        self.published_at = published_at
 
     def __repr__(self):
         return f"<NewsArticle(title={self.title[:50]}, source={self.source})>"
 
 
+class ListingPage:
+    """Articles extracted from one listing page and where to continue."""
+
+    def __init__(
+        self,
+        articles: List[NewsArticle],
+        scanned: int,
+        reached_known: bool,
+        next_url: Optional[str] = None,
+    ):
+        self.articles = articles
+        self.scanned = scanned
+        self.reached_known = reached_known
+        self.next_url = next_url
+
+
 class BaseParser(ABC):
-    """Base class for news parsers."""
+    """Base class for news parsers.
+
+    Subclasses implement ``iter_items``, yielding ``(url, element)`` pairs in
+    listing order (newest first), and ``build_article``, the full extraction
+    for one element; ``parse_document`` turns fetched content into whatever
+    ``iter_items`` walks (an lxml HTML tree by default). Only items with
+    unknown URLs are built, and a listing is abandoned after
+    ``known_run_limit`` known URLs in a row, so the work per run follows the
+    number of new articles rather than the page size.
+
+    Extraction runs in the parse executor, so the parser is pickled without
+    its HTTP client and must not touch the network there.
+    """
 
-    def __init__(self, source_name: str, base_url: str, clubs: List[str]):
+    def __init__(
+        self,
+        source_name: str,
+        base_url: str,
+        listing_url: str,
+        clubs: List[str],
+        http_client: HttpClient,
+        page_url_template: Optional[str] = None,
+        max_pages: int = LISTING_MAX_PAGES,
+        known_run_limit: int = LISTING_KNOWN_RUN_LIMIT,
+        key: Optional[str] = None,
+    ):
+        self.key = key or source_name
         self.source_name = source_name
         self.base_url = base_url
+        self.listing_url = listing_url
         self.clubs = clubs
+        self.http_client = http_client
+        self.page_url_template = page_url_template
+        self.max_pages = max_pages
+        self.known_run_limit = known_run_limit
+        self.skipped_runs = 0
+        self.last_status: Optional[int] = None
+        self.last_error: Optional[str] = None
+        # Set when a later listing page failed; the next crawl does not stop
+        # at known URLs so the pages it missed are reached again
+        self.resume_crawl = False
+        # Validators of pages fetched by the current run, committed once stored
+        self.pending_validators: Dict[str, FetchValidators] = {}
 
-    async def fetch_html(self, url: str) -> Optional[str]:
-        """Fetch HTML content from URL."""
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=10) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        logger.warning(
-                            f"Failed to fetch {url}: status {response.status}"
-                        )
-                        return None
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
+    # Feed parsers take raw bytes so the XML parser can honour the declared encoding
+    decode_body = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["http_client"] = None
+        return state
+
+    async def fetch_page(self, url: str) -> Optional[Union[str, bytes]]:
+        """Fetch a listing page, as text or raw bytes per ``decode_body``.
+
+        Returns None both on errors and when the page has not changed since
+        the previous fetch; the latter is counted in ``skipped_runs``.
+        """
+        result = await self.http_client.fetch_conditional(url, decode=self.decode_body)
+        self.last_status = result.status
+        if result.validators is not None:
+            self.pending_validators[url] = result.validators
+        if result.not_modified:
+            self.skipped_runs += 1
+            logger.info(f"{self.source_name}: {url} not modified, skipping parse")
             return None
+        return result.text if self.decode_body else result.body
+
+    def pop_pending_validators(self) -> Dict[str, FetchValidators]:
+        """Validators of the pages fetched by the last run, cleared afterwards."""
+        validators, self.pending_validators = self.pending_validators, {}
+        return validators
 
     def find_mentioned_clubs(self, text: str) -> List[str]:
         """Find clubs mentioned in text."""
-        mentioned = []
-        text_lower = text.lower()
+        return get_club_matcher(tuple(self.clubs)).find(text)
+
+    async def parse(self, known_urls: AbstractSet[str] = frozenset()) -> List[NewsArticle]:
+        """Crawl listing pages until known articles are reached.
+
+        Returns every new article, including ones that mention no tracked
+        club, so callers can remember their URLs too. A later page that fails
+        to load sets ``last_error`` while keeping the articles found so far,
+        and the next crawl walks every page instead of stopping at known URLs.
+        """
+        articles: List[NewsArticle] = []
+        self.last_error = None
+        self.pending_validators = {}
+        known = set(known_urls)
+        url = self.listing_url
+        first_status = None
+        pages = 0
+        scanned = 0
+        stop_at_known = not self.resume_crawl
+        resume = False
 
-        for club in self.clubs:
-            if club.lower() in text_lower:
-                mentioned.append(club)
+        try:
+            while url and pages < self.max_pages:
+                content = await self.fetch_page(url)
+                if first_status is None:
+                    first_status = self.last_status
+                if not content:
+                    # 404/410 past the last page just ends the listing
+                    if pages and self.last_status not in (200, 304, 404, 410):
+                        # Keeps page 1's validators uncommitted so the
+                        # partial crawl is retried in full next run
+                        self.last_error = f"page {pages + 1} failed with status {self.last_status}"
+                        logger.warning(f"{self.source_name}: {self.last_error}")
+                        resume = True
+                    break
+                pages += 1
+
+                page = await run_in_parse_executor(
+                    self.extract, content, frozenset(known), pages, stop_at_known
+                )
+                articles.extend(page.articles)
+                known.update(article.url for article in page.articles)
+                scanned += page.scanned
+
+                if page.reached_known:
+                    break
+                url = page.next_url
+
+            # Only the first page decides whether the source is healthy
+            self.last_status = first_status
+            self.resume_crawl = resume
+            logger.info(
+                f"Parsed {len(articles)} new articles from {self.source_name} "
+                f"({scanned} items scanned on {pages} pages)"
+            )
+
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Error parsing {self.source_name}: {e}")
+
+        return articles
+
+    def extract(
+        self,
+        content: Union[str, bytes],
+        known_urls: AbstractSet[str] = frozenset(),
+        page: int = 1,
+        stop_at_known: bool = True,
+    ) -> ListingPage:
+        """Extract articles for unknown URLs from one listing page.
+
+        With ``stop_at_known`` a run of ``known_run_limit`` known URLs ends the
+        listing; otherwise known URLs are only skipped.
+        """
+        document = self.parse_document(content)
+        articles = []
+        built = set()
+        scanned = 0
+        known_run = 0
 
-        return mentioned
+        for url, item in self.iter_items(document):
+            scanned += 1
+            if url in known_urls:
+                known_run += 1
+                if stop_at_known and known_run >= self.known_run_limit:
+                    return ListingPage(articles, scanned, reached_known=True)
+                continue
+            known_run = 0
+
+            # The same article is often linked from several blocks of a page
+            if url in built:
+                continue
+            built.add(url)
+
+            try:
+                article = self.build_article(item, url)
+            except Exception as e:
+                logger.error(f"Error parsing {self.source_name} news item: {e}")
+                continue
+            if article:
+                articles.append(article)
+
+        return ListingPage(
+            articles, scanned, reached_known=False, next_url=self.next_page_url(document, page)
+        )
+
+    def next_page_url(self, document: Any, page: int) -> Optional[str]:
+        """URL of the listing page after ``page``, if any."""
+        if self.page_url_template:
+            return self.page_url_template.format(page=page + 1)
+        return None
+
+    def absolute_url(self, link: str) -> str:
+        """Resolve a relative link against the source base URL."""
+        return urljoin(self.base_url, link)
+
+    @property
+    def last_run_failed(self) -> bool:
+        """Whether the last parse hit an error or a non-200/304 response."""
+        return self.last_error is not None or self.last_status not in (200, 304)
+
+    @abstractmethod
+    def iter_items(self, document: Any) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(absolute url, item element)`` for listing items in page order."""
+        pass
 
     @abstractmethod
-    async def parse(self) -> List[NewsArticle]:
-        """Parse news from the source."""
+    def build_article(self, item: Any, url: str) -> Optional[NewsArticle]:
+        """Extract title, description and club mentions for one item."""
         pass
 
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML with BeautifulSoup."""
-        return BeautifulSoup(html, "lxml")
+    def parse_document(self, content: Union[str, bytes]) -> Any:
+        """Parse HTML into an lxml tree."""
+        return lxml.html.fromstring(content)
@@ -0,0 +1,132 @@
+"""Multi-pattern club matcher (Aho–Corasick) with aliases and inflections."""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import CLUB_ALIASES
+
+# Case endings for single-word Russian club names, keyed by the final letter.
+# The empty key covers stems ending in a consonant.
+_DECLENSIONS = {
+    "": ("", "а", "у", "ом", "е", "ы", "ов", "ам", "ами", "ах"),
+    "а": ("а", "ы", "е", "у", "ой", "ою"),
+    "я": ("я", "и", "е", "ю", "ей"),
+    "й": ("й", "я", "ю", "ем", "е"),
+    "ь": ("ь", "я", "ю", "ем", "е"),
+}
+_VOWELS = set("аеёиоуыэюяaeiouy")
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and fold ё to е without changing its length."""
+    return text.lower().replace("ё", "е")
+
+
+def inflect(name: str) -> List[str]:
+    """Return the name together with its common Russian case forms.
+
+    Only single-word Cyrillic names are inflected; abbreviations (ЦСКА, ПСЖ),
+    multi-word and indeclinable names are returned as-is and rely on aliases.
+    """
+    if " " in name or name.isupper() or not any("а" <= ch <= "я" for ch in name.lower()):
+        return [name]
+
+    last = name[-1].lower()
+    if last in _DECLENSIONS:
+        stem = name[:-1]
+        endings = _DECLENSIONS[last]
+    elif last in _VOWELS:
+        return [name]
+    else:
+        stem = name
+        endings = _DECLENSIONS[""]
+
+    return [stem + ending for ending in endings]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split normalized text into words; punctuation and hyphens separate them."""
+    return _WORD_RE.findall(normalize(text))
+
+
+class ClubMatcher:
+    """Find clubs mentioned in text in a single pass over it.
+
+    The automaton runs over word tokens rather than characters, so matches
+    always fall on word boundaries ("Динамо" never matches "Гидродинамо") and
+    the per-text cost is one dict lookup per word whatever the club count.
+    """
+
+    def __init__(
+        self, clubs: Iterable[str], aliases: Optional[Dict[str, List[str]]] = None
+    ):
+        self.clubs = list(clubs)
+        aliases = aliases or {}
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for club in self.clubs:
+            for pattern in [club, *aliases.get(club, [])]:
+                for form in inflect(pattern):
+                    self._add_pattern(tokenize(form), club)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, tokens: List[str], club: str):
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if club not in self._output[state]:
+            self._output[state].append(club)
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find(self, text: str) -> List[str]:
+        """Return clubs mentioned as whole words, in configured club order."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set()
+
+        state = 0
+        for token in tokenize(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                found.update(output[state])
+
+        if not found:
+            return []
+        return [club for club in self.clubs if club in found]
+
+
+@lru_cache(maxsize=8)
+def get_club_matcher(clubs: Tuple[str, ...]) -> ClubMatcher:
+    """Build the matcher once per process for a given club list."""
+    return ClubMatcher(clubs, aliases=CLUB_ALIASES)
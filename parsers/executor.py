@@ -0,0 +1,82 @@
+"""Executor that keeps HTML parsing off the asyncio event loop."""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from config import PARSE_EXECUTOR, PARSE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[Executor] = None
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """Return the shared parse executor, creating it on first use.
+
+    ``PARSE_EXECUTOR`` selects "process" (default), "thread" or "inline".
+    A process pool that cannot be started falls back to threads.
+    """
+    global _executor
+
+    if _executor is not None or PARSE_EXECUTOR == "inline":
+        return _executor
+
+    if PARSE_EXECUTOR == "process":
+        try:
+            # spawn avoids forking a process that runs an event loop and threads
+            _executor = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Parsing in a process pool with {PARSE_WORKERS} workers")
+            return _executor
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"Process pool unavailable ({e}), falling back to threads")
+
+    _executor = ThreadPoolExecutor(
+        max_workers=PARSE_WORKERS, thread_name_prefix="parser"
+    )
+    logger.info(f"Parsing in a thread pool with {PARSE_WORKERS} workers")
+    return _executor
+
+
+def _discard_broken_executor(executor: Executor):
+    global _executor
+
+    # Concurrent callers see the same broken pool; only the first resets it
+    if _executor is executor:
+        _executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Parse worker died, restarting the process pool")
+
+
+async def run_in_parse_executor(func: Callable[..., Any], *args) -> Any:
+    """Run a picklable callable in the parse executor and await its result.
+
+    A process pool broken by a dying worker (OOM kill, failed spawn) is
+    replaced and the call retried once; a second failure propagates, and the
+    next call starts with a fresh pool again.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = get_parse_executor()
+        if executor is None:
+            return func(*args)
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            _discard_broken_executor(executor)
+            if attempt:
+                raise
+
+
+def shutdown_parse_executor():
+    """Stop worker processes or threads."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
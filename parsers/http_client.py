@@ -0,0 +1,169 @@
+"""Shared HTTP client for news parsers."""
+import hashlib
+import logging
+from typing import Dict, Optional, Set
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+class FetchValidators:
+    """Cache validators remembered for a URL between fetches."""
+
+    def __init__(
+        self,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+
+    def __repr__(self):
+        return f"<FetchValidators(etag={self.etag}, hash={self.content_hash})>"
+
+
+class FetchResult:
+    """Outcome of a conditional fetch.
+
+    ``validators`` is set when the response carries validators that differ
+    from the remembered ones; they take effect only once passed to
+    ``HttpClient.commit_validators``.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        text: Optional[str] = None,
+        not_modified: bool = False,
+        body: Optional[bytes] = None,
+        validators: Optional[FetchValidators] = None,
+    ):
+        self.status = status
+        self.text = text
+        self.not_modified = not_modified
+        self.body = body
+        self.validators = validators
+
+
+class HttpClient:
+    """Long-lived pooled HTTP client shared by all parsers."""
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        connect_timeout: float = 5,
+        pool_limit: int = 20,
+        pool_limit_per_host: int = 4,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.headers = {"User-Agent": user_agent}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.validators: Dict[str, FetchValidators] = {}
+        self.dirty_urls: Set[str] = set()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the session lazily so it is bound to the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout, headers=self.headers
+            )
+        return self._session
+
+    def load_validators(self, validators: Dict[str, FetchValidators]):
+        """Restore validators persisted by a previous run."""
+        self.validators.update(validators)
+
+    def commit_validators(self, validators: Dict[str, FetchValidators]):
+        """Remember validators of pages whose content has been fully processed."""
+        for url, page_validators in validators.items():
+            self.validators[url] = page_validators
+            self.dirty_urls.add(url)
+
+    def pop_dirty_validators(self) -> Dict[str, FetchValidators]:
+        """Return validators changed since the last call and reset tracking."""
+        changed = {url: self.validators[url] for url in self.dirty_urls}
+        self.dirty_urls.clear()
+        return changed
+
+    async def fetch_conditional(self, url: str, decode: bool = True) -> FetchResult:
+        """Fetch URL with If-None-Match/If-Modified-Since and a body digest check.
+
+        A 304 response or a body identical to the previous one is reported as
+        ``not_modified`` so callers can skip parsing entirely. With
+        ``decode=False`` only the raw ``body`` is returned. New validators are
+        returned rather than stored, so a page whose articles fail to be
+        stored is fetched in full again next time.
+        """
+        cached = self.validators.get(url)
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            session = self._get_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return FetchResult(status=304, not_modified=True)
+
+                if response.status != 200:
+                    logger.warning(f"Failed to fetch {url}: status {response.status}")
+                    return FetchResult(status=response.status)
+
+                body = await response.read()
+                content_hash = hashlib.sha256(body).hexdigest()
+                validators = FetchValidators(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    content_hash=content_hash,
+                )
+                unchanged = cached is not None and cached.content_hash == content_hash
+                if (
+                    cached is not None
+                    and cached.content_hash == validators.content_hash
+                    and cached.etag == validators.etag
+                    and cached.last_modified == validators.last_modified
+                ):
+                    validators = None
+
+                if unchanged:
+                    return FetchResult(status=200, not_modified=True, validators=validators)
+
+                if not decode:
+                    return FetchResult(status=200, body=body, validators=validators)
+
+                encoding = response.get_encoding()
+                return FetchResult(
+                    status=200,
+                    text=body.decode(encoding, errors="replace"),
+                    body=body,
+                    validators=validators,
+                )
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return FetchResult(status=0)
+
+    async def close(self):
+        """Close the underlying session and its connection pool."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
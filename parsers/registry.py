@@ -0,0 +1,66 @@
+"""Construction of parsers from NEWS_SOURCES specs."""
+import logging
+from typing import Any, Dict, List
+from .base_parser import BaseParser
+from .feed_parser import FeedParser
+from .http_client import HttpClient
+from .selector_parser import SelectorParser
+
+logger = logging.getLogger(__name__)
+
+PARSER_MODES = {
+    "html": SelectorParser,
+    "feed": FeedParser,
+}
+
+
+def create_parser(
+    key: str, spec: Dict[str, Any], clubs: List[str], http_client: HttpClient
+) -> BaseParser:
+    """Build the parser for a source spec according to its ``mode``."""
+    mode = spec.get("mode", "html")
+    if mode not in PARSER_MODES:
+        raise ValueError(f"Source {key} has unknown mode {mode!r}")
+    return PARSER_MODES[mode](key, spec, clubs=clubs, http_client=http_client)
+
+
+class ParserRegistry:
+    """Live set of parsers kept in sync with a source spec mapping.
+
+    ``apply`` rebuilds only sources whose spec changed. A spec that fails to
+    build keeps the previous parser for that source, so a typo in a selector
+    never takes a working source down.
+    """
+
+    def __init__(self, clubs: List[str], http_client: HttpClient):
+        self.clubs = clubs
+        self.http_client = http_client
+        self.parsers: Dict[str, BaseParser] = {}
+        self.specs: Dict[str, Dict[str, Any]] = {}
+
+    def apply(self, specs: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Sync parsers with ``specs``; return added, updated and removed keys."""
+        changes: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+        enabled = {
+            key: spec for key, spec in specs.items() if spec.get("enabled", True)
+        }
+
+        for key in list(self.parsers):
+            if key not in enabled:
+                del self.parsers[key]
+                del self.specs[key]
+                changes["removed"].append(key)
+
+        for key, spec in enabled.items():
+            if self.specs.get(key) == spec:
+                continue
+            try:
+                parser = create_parser(key, spec, self.clubs, self.http_client)
+            except Exception as e:
+                logger.error(f"Invalid spec for source {key}, keeping previous: {e}")
+                continue
+            changes["updated" if key in self.parsers else "added"].append(key)
+            self.parsers[key] = parser
+            self.specs[key] = spec
+
+        return changes
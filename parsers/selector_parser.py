@@ -0,0 +1,114 @@
+"""Generic listing parser driven by a declarative per-source selector spec."""
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from .base_parser import BaseParser, NewsArticle
+from .http_client import HttpClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SELECTORS = {
+    "link": "a[href]",
+    "next_page": 'link[rel="next"][href], a[rel="next"][href]',
+}
+REQUIRED_SELECTORS = ("item", "title")
+
+
+@lru_cache(maxsize=256)
+def compile_selector(css: str) -> CSSSelector:
+    """Translate a CSS selector to XPath once per process."""
+    return CSSSelector(css)
+
+
+def element_text(element: HtmlElement) -> str:
+    """Text content of an element with whitespace collapsed."""
+    return " ".join(element.text_content().split())
+
+
+class SelectorParser(BaseParser):
+    """Parser for any listing page described by CSS selectors.
+
+    A source spec (see ``NEWS_SOURCES`` in config) names the listing URL and
+    selectors for items and, within an item, the title, link and description.
+    Selectors are compiled to XPath once and evaluated on lxml trees; items
+    nested inside another matched item are skipped, so broad patterns such as
+    ``[class*='article']`` do not yield the same article twice.
+    """
+
+    def __init__(
+        self, key: str, spec: Dict[str, Any], clubs: List[str], http_client: HttpClient
+    ):
+        super().__init__(
+            source_name=spec["name"],
+            base_url=spec["base_url"],
+            listing_url=spec["listing_url"],
+            clubs=clubs,
+            http_client=http_client,
+            page_url_template=spec.get("page_url_template"),
+            key=key,
+        )
+        self.selectors = {**DEFAULT_SELECTORS, **spec["selectors"]}
+
+        missing = [name for name in REQUIRED_SELECTORS if not self.selectors.get(name)]
+        if missing:
+            raise ValueError(f"Source {key} has no {', '.join(missing)} selector")
+
+        # Fail on a bad selector at startup rather than on the first fetch
+        for css in self.selectors.values():
+            if css:
+                compile_selector(css)
+
+    def _select(self, name: str, element: HtmlElement) -> List[HtmlElement]:
+        css = self.selectors.get(name)
+        return compile_selector(css)(element) if css else []
+
+    def _select_one(self, name: str, element: HtmlElement) -> Optional[HtmlElement]:
+        found = self._select(name, element)
+        return found[0] if found else None
+
+    def iter_items(self, document: HtmlElement) -> Iterator[Tuple[str, HtmlElement]]:
+        """Yield outermost matched items that contain a link, in page order."""
+        items = self._select("item", document)
+        matched = set(items)
+
+        for item in items:
+            if any(ancestor in matched for ancestor in item.iterancestors()):
+                continue
+
+            link_elem = self._select_one("link", item)
+            href = link_elem.get("href") if link_elem is not None else None
+            if not href:
+                continue
+            yield self.absolute_url(href), item
+
+    def build_article(self, item: HtmlElement, url: str) -> Optional[NewsArticle]:
+        """Extract title, description and club mentions for one item."""
+        title_elem = self._select_one("title", item)
+        if title_elem is None:
+            return None
+
+        title = element_text(title_elem)
+        if not title:
+            return None
+
+        desc_elem = self._select_one("description", item)
+        description = element_text(desc_elem) if desc_elem is not None else None
+
+        full_text = f"{title} {description or ''}"
+
+        return NewsArticle(
+            title=title,
+            url=url,
+            source=self.source_name,
+            description=description or None,
+            clubs_mentioned=self.find_mentioned_clubs(full_text),
+        )
+
+    def next_page_url(self, document: HtmlElement, page: int) -> Optional[str]:
+        """Follow a rel="next" link, falling back to the page URL template."""
+        link = self._select_one("next_page", document)
+        if link is not None and link.get("href"):
+            return self.absolute_url(link.get("href"))
+        return super().next_page_url(document, page)
@@ -0,0 +1,179 @@
+"""Retention of old news: batched archival, deletion and compaction."""
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from database import Database, NewsItem
+from config import (
+    DATABASE_URL,
+    RETENTION_DAYS,
+    RETENTION_BATCH_SIZE,
+    RETENTION_ARCHIVE_DIR,
+    RETENTION_INTERVAL_HOURS,
+    RETENTION_VACUUM_PAGES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Pause between batches so bot reads and scraper writes get the database
+BATCH_PAUSE_SECONDS = 0.1
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def news_record(item: NewsItem) -> dict:
+    """Archive representation of a news item."""
+    return {
+        "id": item.id,
+        "title": item.title,
+        "url": item.url,
+        "source": item.source,
+        "description": item.description,
+        "clubs_mentioned": item.clubs_mentioned,
+        "story_id": item.story_id,
+        "published_at": _isoformat(item.published_at),
+        "created_at": _isoformat(item.created_at),
+    }
+
+
+class NewsArchive:
+    """Appends archived news to one gzip-compressed JSONL file per run."""
+
+    def __init__(self, directory: str):
+        self.path = os.path.join(
+            directory, f"news-{datetime.utcnow():%Y%m%d-%H%M%S}.jsonl.gz"
+        )
+        self.directory = directory
+
+    def write(self, records: List[dict]):
+        """Append records; blocking, run it in a thread."""
+        os.makedirs(self.directory, exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class RetentionService:
+    """Removes news older than the retention period on an interval.
+
+    Each batch is archived and deleted in its own short transaction so the
+    database is never write-locked for long; the run ends with a compaction
+    that returns freed pages and refreshes planner statistics.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        days: int = RETENTION_DAYS,
+        batch_size: int = RETENTION_BATCH_SIZE,
+        archive_dir: str = RETENTION_ARCHIVE_DIR,
+        interval_hours: float = RETENTION_INTERVAL_HOURS,
+        vacuum_pages: int = RETENTION_VACUUM_PAGES,
+    ):
+        self.db = db
+        self.max_age = timedelta(days=days)
+        self.batch_size = batch_size
+        self.archive_dir = archive_dir
+        self.interval = interval_hours * 3600
+        self.vacuum_pages = vacuum_pages
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> dict:
+        """Archive and delete expired news, then compact; returns run stats."""
+        cutoff = datetime.utcnow() - self.max_age
+        archive = NewsArchive(self.archive_dir) if self.archive_dir else None
+        size_before = await self.db.get_storage_size()
+        removed = archived = 0
+
+        while True:
+            items = await self.db.get_news_before(cutoff, self.batch_size)
+            if not items:
+                break
+            if archive:
+                await asyncio.to_thread(archive.write, [news_record(item) for item in items])
+                archived += len(items)
+            removed += await self.db.delete_news_items([item.id for item in items])
+            if len(items) < self.batch_size:
+                break
+            await asyncio.sleep(BATCH_PAUSE_SECONDS)
+
+        if removed:
+            await self.db.compact(self.vacuum_pages)
+        reclaimed = size_before - await self.db.get_storage_size()
+
+        stats = {
+            "removed": removed,
+            "archived": archived,
+            "reclaimed_bytes": max(reclaimed, 0),
+            "archive": archive.path if archive and archived else None,
+        }
+        logger.info(
+            f"Retention: removed {removed} news older than {cutoff:%Y-%m-%d %H:%M}, "
+            f"archived {archived}, reclaimed {stats['reclaimed_bytes'] / 1024 / 1024:.1f} MiB"
+        )
+        return stats
+
+    async def _run_loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Retention run failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Run retention now and then every ``RETENTION_INTERVAL_HOURS``."""
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(
+            f"Retention started: keep {self.max_age.days} days, "
+            f"every {self.interval / 3600:g} h"
+        )
+
+    async def stop(self):
+        """Cancel the retention loop."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+async def main():
+    """One-off maintenance: convert the SQLite file or run retention once."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="rewrite an existing SQLite file so retention can return free pages",
+    )
+    parser.add_argument("--once", action="store_true", help="run retention once and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    db = Database(DATABASE_URL)
+    await db.init_db()
+    try:
+        if args.enable_incremental_vacuum:
+            if await db.enable_incremental_vacuum():
+                logger.info("SQLite file converted to incremental auto_vacuum")
+            else:
+                logger.info("Nothing to convert")
+        if args.once:
+            await RetentionService(db).run_once()
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""Entry point for the news ingestion worker."""
+import asyncio
+import logging
+import signal
+import sys
+from contextlib import suppress
+
+from config import DATABASE_URL, RETENTION_DAYS
+from database import Database
+from news_service import NewsService
+from retention import RetentionService
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperWorker:
+    """Runs NewsService on per-source schedules; shares only the database with the bot."""
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.news_service: NewsService = None
+        self.retention: RetentionService = None
+
+    async def start(self):
+        """Load scraper state and start polling every source right away."""
+        self.news_service = NewsService(self.db)
+        await self.news_service.start()
+        self.news_service.start_scheduling()
+        if RETENTION_DAYS > 0:
+            self.retention = RetentionService(self.db)
+            self.retention.start()
+
+    async def stop(self):
+        """Stop the schedules and release scraper resources."""
+        if self.retention:
+            await self.retention.stop()
+            self.retention = None
+        if self.news_service:
+            await self.news_service.stop_scheduling()
+            logger.info("Scheduler stopped")
+            logger.info(f"Source stats: {self.news_service.get_source_stats()}")
+            logger.info(
+                f"Seen-URL cache: {len(self.news_service.seen_urls)} URLs, "
+                f"hit rate {self.news_service.seen_urls.hit_rate:.1%}"
+            )
+            await self.news_service.close()
+            self.news_service = None
+            logger.info("HTTP client closed")
+
+
+async def main():
+    """Run the scraper worker until SIGTERM or SIGINT."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler("scraper.log"),
+        ],
+    )
+
+    db = Database(DATABASE_URL)
+    await db.init_db()
+    worker = ScraperWorker(db)
+
+    # docker stop sends SIGTERM; without a handler the cleanup below never runs
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
+
+    try:
+        await worker.start()
+        await stop_event.wait()
+        logger.info("Stop signal received")
+    finally:
+        await worker.stop()
+        await db.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Scraper stopped")
@@ -0,0 +1,121 @@
+"""Effective news source configuration: defaults, a watched file and DB overrides."""
+import copy
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from config import NEWS_SOURCES
+from database import Database
+
+logger = logging.getLogger(__name__)
+
+SOURCE_OVERRIDES_KEY = "source_overrides"
+
+
+def merge_source_specs(
+    base: Dict[str, Dict[str, Any]], overrides: Dict[str, Optional[Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    """Apply partial per-source overrides; a None override removes the source.
+
+    Override keys replace spec keys, except ``selectors``, which are merged
+    one level deeper so a single selector can be changed on its own.
+    """
+    merged = copy.deepcopy(base)
+    for key, override in overrides.items():
+        if override is None:
+            merged.pop(key, None)
+            continue
+        spec = merged.setdefault(key, {})
+        for field, value in override.items():
+            if field == "selectors" and isinstance(value, dict):
+                spec["selectors"] = {**spec.get("selectors", {}), **value}
+            else:
+                spec[field] = value
+    return merged
+
+
+class SourceConfig:
+    """Builds the effective NEWS_SOURCES and tells when it may have changed.
+
+    Layers, later ones winning: ``config.NEWS_SOURCES``, the JSON file at
+    ``path`` (same shape, partial specs allowed) and overrides stored in
+    ``app_state`` by admin commands. Both the file and the overrides can
+    change while the bot and scraper are running.
+    """
+
+    def __init__(self, db: Database, path: Optional[str] = None):
+        self.db = db
+        self.path = path
+        self._file_mtime: Optional[float] = None
+        self._file_specs: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._overrides_raw: Optional[str] = None
+
+    def _read_file(self) -> bool:
+        """Reload the sources file if its mtime changed; return whether it did."""
+        if not self.path:
+            return False
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+
+        if mtime == self._file_mtime:
+            return False
+        self._file_mtime = mtime
+
+        if mtime is None:
+            logger.warning(f"Sources file {self.path} not found, using defaults")
+            self._file_specs = {}
+            return True
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._file_specs = json.load(f)
+            logger.info(f"Loaded {len(self._file_specs)} sources from {self.path}")
+        except (OSError, ValueError) as e:
+            # Keep the previous file contents rather than dropping sources
+            logger.error(f"Error reading sources file {self.path}: {e}")
+        return True
+
+    async def get_overrides(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Per-source overrides saved by admin commands."""
+        raw = await self.db.get_app_state(SOURCE_OVERRIDES_KEY)
+        return json.loads(raw) if raw else {}
+
+    async def set_override(self, key: str, override: Optional[Dict[str, Any]]):
+        """Merge a partial spec into the stored override for a source."""
+        overrides = await self.get_overrides()
+        if override is None or overrides.get(key) is None:
+            overrides[key] = override
+        else:
+            overrides[key] = merge_source_specs({key: overrides[key]}, {key: override})[key]
+        await self.db.set_app_state(
+            SOURCE_OVERRIDES_KEY, json.dumps(overrides, ensure_ascii=False)
+        )
+
+    async def clear_override(self, key: str) -> bool:
+        """Drop the stored override for a source; return whether one existed."""
+        overrides = await self.get_overrides()
+        if key not in overrides:
+            return False
+        del overrides[key]
+        await self.db.set_app_state(
+            SOURCE_OVERRIDES_KEY, json.dumps(overrides, ensure_ascii=False)
+        )
+        return True
+
+    async def load(self) -> Dict[str, Dict[str, Any]]:
+        """Effective source specs right now."""
+        self._read_file()
+        self._overrides_raw = await self.db.get_app_state(SOURCE_OVERRIDES_KEY)
+        overrides = json.loads(self._overrides_raw) if self._overrides_raw else {}
+        return merge_source_specs(
+            merge_source_specs(NEWS_SOURCES, self._file_specs), overrides
+        )
+
+    async def changed(self) -> bool:
+        """Whether the file or the stored overrides changed since ``load``."""
+        file_changed = self._read_file()
+        raw = await self.db.get_app_state(SOURCE_OVERRIDES_KEY)
+        return file_changed or raw != self._overrides_raw
@@ -0,0 +1,189 @@
+"""Near-duplicate story detection with MinHash signatures and an LSH index."""
+import hashlib
+import random
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from database.search import stem
+from parsers.club_matcher import tokenize
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+MIN_WORD_LENGTH = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1_000_003)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def shingles(text: str) -> Set[int]:
+    """Stable 64-bit hashes of the stemmed words of a text."""
+    return {
+        int.from_bytes(hashlib.blake2b(stem(word).encode(), digest_size=8).digest(), "big")
+        for word in tokenize(text)
+        if len(word) >= MIN_WORD_LENGTH
+    }
+
+
+def minhash(features: Set[int]) -> Optional[Tuple[int, ...]]:
+    """MinHash signature; two signatures agree in a share of positions that
+    estimates the Jaccard similarity of the underlying word sets."""
+    if not features:
+        return None
+    return tuple(
+        min((a * feature + b) % _MERSENNE_PRIME for feature in features)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def signature_for(title: str, description: Optional[str]) -> Optional[Tuple[int, ...]]:
+    """Signature of a news item's normalized title and description."""
+    return minhash(shingles(f"{title} {description or ''}"))
+
+
+def signatures_for(
+    texts: List[Tuple[str, Optional[str]]]
+) -> List[Optional[Tuple[int, ...]]]:
+    """Signatures of many (title, description) pairs; picklable for executors."""
+    return [signature_for(title, description) for title, description in texts]
+
+
+def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(left, right) if a == b) / NUM_PERMUTATIONS
+
+
+def _band_keys(signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+    return [
+        (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+        for band in range(BANDS)
+    ]
+
+
+class _Entry:
+    __slots__ = ("story_id", "source", "signature", "added_at")
+
+    def __init__(
+        self,
+        story_id: int,
+        source: str,
+        signature: Tuple[int, ...],
+        added_at: datetime,
+    ):
+        self.story_id = story_id
+        self.source = source
+        self.signature = signature
+        self.added_at = added_at
+
+
+class StoryIndex:
+    """Incremental LSH index of recent news, bounded by age and size.
+
+    Signatures are split into bands; items sharing any band are candidates
+    and are confirmed by estimated similarity. An item only joins a story
+    whose clubs cover all of its own: copies are hidden from club feeds and
+    pushes in favour of the story root, so a copy that mentions another club
+    must stay a story of its own to reach that club's followers.
+    A story collects at most one item per source: two similar articles from
+    the same outlet ("Зенит обыграл Спартак" / "Спартак обыграл Зенит") are
+    different news, not copies.
+    With 16 bands of 4 rows, pairs above ~0.5 similarity almost always
+    collide while unrelated items almost never do, so a lookup touches a
+    handful of entries regardless of how many are indexed.
+    """
+
+    def __init__(self, window: timedelta, max_size: int, threshold: float = 0.5):
+        self.window = window
+        self.max_size = max_size
+        self.threshold = threshold
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[int]] = {}
+        # Sources of the indexed items of each story
+        self._story_sources: Dict[int, Counter] = {}
+        # Clubs of the indexed items of each story, a subset of the root's
+        self._story_clubs: Dict[int, Set[str]] = {}
+        self.lookups = 0
+        self.matches = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def has_source(self, story_id: int, source: str) -> bool:
+        """Whether an indexed item of the story comes from ``source``."""
+        return source in self._story_sources.get(story_id, ())
+
+    def find_story(
+        self, signature: Tuple[int, ...], clubs: Iterable[str], source: str
+    ) -> Optional[int]:
+        """Story id of the most similar item from another source, if similar enough.
+
+        Stories that already have an item from ``source`` or that do not
+        mention all of ``clubs`` are skipped.
+        """
+        self.lookups += 1
+        clubs = set(clubs)
+        candidates: Set[int] = set()
+        for key in _band_keys(signature):
+            candidates |= self._buckets.get(key, set())
+
+        best_story, best_score = None, self.threshold
+        for news_id in candidates:
+            entry = self._entries[news_id]
+            if not clubs <= self._story_clubs[entry.story_id]:
+                continue
+            if self.has_source(entry.story_id, source):
+                continue
+            score = similarity(signature, entry.signature)
+            if score >= best_score:
+                best_story, best_score = entry.story_id, score
+
+        if best_story is not None:
+            self.matches += 1
+        return best_story
+
+    def add(
+        self,
+        news_id: int,
+        story_id: int,
+        source: str,
+        signature: Tuple[int, ...],
+        clubs: Iterable[str],
+        added_at: Optional[datetime] = None,
+    ):
+        """Index an item under its story."""
+        if news_id in self._entries:
+            return
+        self._entries[news_id] = _Entry(
+            story_id, source, signature, added_at or datetime.utcnow()
+        )
+        self._story_sources.setdefault(story_id, Counter())[source] += 1
+        self._story_clubs.setdefault(story_id, set()).update(clubs)
+        for key in _band_keys(signature):
+            self._buckets.setdefault(key, set()).add(news_id)
+        self._evict()
+
+    def _evict(self):
+        cutoff = datetime.utcnow() - self.window
+        while self._entries:
+            news_id, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_size and entry.added_at >= cutoff:
+                break
+            self._entries.popitem(last=False)
+            sources = self._story_sources[entry.story_id]
+            sources[entry.source] -= 1
+            if sources[entry.source] <= 0:
+                del sources[entry.source]
+                if not sources:
+                    del self._story_sources[entry.story_id]
+                    del self._story_clubs[entry.story_id]
+            for key in _band_keys(entry.signature):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(news_id)
+                    if not bucket:
+                        del self._buckets[key]